@@ -10,10 +10,12 @@ Uses st.connection() for better connection management when running in Streamlit.
 import mysql.connector
 import pandas as pd
 import hashlib
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from dotenv import load_dotenv
 import os
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 
 # Load environment variables from .env file (fallback for non-Streamlit execution)
 load_dotenv()
@@ -110,6 +112,13 @@ CACHE_ENABLED = _parse_bool(_get_config_value('CACHE_ENABLED', True))
 CACHE_TTL_SECONDS = int(_get_config_value('CACHE_TTL_SECONDS', 9999))
 _query_cache = {}  # In-memory cache storage per node
 
+# Rows pulled from the server per fetchmany() call on manual connections
+FETCH_BATCH_SIZE = 500
+
+# Seconds a node's connectivity check result is reused by check_connectivity()
+CONNECTIVITY_TTL = 1.0
+_connectivity_cache: Dict[int, Tuple[float, bool]] = {}  # node -> (monotonic time, is_up)
+
 # Node Selection (which node this instance connects to)
 NODE_USE = int(_get_config_value('NODE_USE', 1))
 if NODE_USE not in [1, 2, 3]:
@@ -245,10 +254,10 @@ STREAMLIT_CONN_NAMES = {
 # HELPER FUNCTIONS
 # ============================================================================
 
-def _generate_cache_key(query: str, node: int) -> str:
-    """Generate a unique cache key for a query and node combination."""
+def _generate_cache_key(query: str, node: int, params: Optional[tuple] = None) -> str:
+    """Generate a unique cache key for a query, its parameters and node combination."""
     normalized_query = ' '.join(query.strip().lower().split())
-    cache_input = f"node{node}:{normalized_query}"
+    cache_input = f"node{node}:{normalized_query}:{params!r}"
     return hashlib.md5(cache_input.encode()).hexdigest()
 
 
@@ -320,7 +329,9 @@ def get_db_connection(node: int) -> mysql.connector.connection.MySQLConnection:
             password=config["password"],
             database=config["database"],
             autocommit=False,
-            connect_timeout=10
+            connect_timeout=10,
+            # Compress the protocol only over the network to Cloud SQL; it costs CPU on local Docker
+            compress=USE_CLOUD_SQL
         )
         print(f"[DB_CONFIG] Successfully connected to {config_type} Node {node}")
         return conn
@@ -342,16 +353,35 @@ def get_db_connection(node: int) -> mysql.connector.connection.MySQLConnection:
         )
 
 
-def fetch_data(query: str, node: int, ttl: int = 9999) -> pd.DataFrame:
+def _apply_dtypes(df: pd.DataFrame, dtype_backend: Optional[str],
+                  dtypes: Optional[Dict[str, Any]]) -> pd.DataFrame:
+    """
+    Cast a result frame to an explicit column schema, or else convert it to the
+    requested dtype backend ("pyarrow" or "numpy_nullable")
+    """
+    if dtypes:
+        return df.astype({col: dtype for col, dtype in dtypes.items() if col in df.columns})
+    if dtype_backend is not None:
+        return df.convert_dtypes(dtype_backend=dtype_backend)
+    return df
+
+
+def fetch_data(query: str, node: int, ttl: int = 9999, params: Optional[tuple] = None,
+               dtype_backend: Optional[str] = None, dtypes: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
     """
     Execute a SQL query and return results as a pandas DataFrame from a specific node.
     Uses st.connection() when running in Streamlit for better caching.
     Falls back to direct MySQL connection when not in Streamlit.
 
     Args:
-        query: SQL query to execute
+        query: SQL query to execute (use %s placeholders when passing params)
         node: Node number (1, 2, or 3) to query from
         ttl: Time-to-live for cached results in seconds
+        params: Values bound to the query's %s placeholders
+        dtype_backend: Return columns with "pyarrow" or "numpy_nullable" dtypes
+                       instead of the default numpy/object dtypes
+        dtypes: Column -> dtype schema the result is cast to (takes precedence over
+                dtype_backend), so results from different nodes always line up
 
     Returns:
         Query results as DataFrame
@@ -363,7 +393,8 @@ def fetch_data(query: str, node: int, ttl: int = 9999) -> pd.DataFrame:
         raise ValueError(f"Invalid node number: {node}. Must be 1, 2, or 3.")
 
     # Try to use Streamlit connection if available
-    if _is_running_in_streamlit():
+    # (parameterized queries use %s placeholders, which st.connection doesn't take)
+    if params is None and _is_running_in_streamlit():
         try:
             import streamlit as st
             config_type = "cloud" if USE_CLOUD_SQL else "local"
@@ -372,32 +403,42 @@ def fetch_data(query: str, node: int, ttl: int = 9999) -> pd.DataFrame:
             # Check if the connection exists in secrets
             if hasattr(st.secrets, 'connections') and hasattr(st.secrets.connections, conn_name):
                 conn = st.connection(conn_name, type='sql')
-                return conn.query(query, ttl=ttl)
+                return _apply_dtypes(conn.query(query, ttl=ttl), dtype_backend, dtypes)
             else:
                 print(f"[DB_CONFIG] Connection {conn_name} not found, using manual connection")
         except Exception as e:
             print(f"[DB_CONFIG] Streamlit connection failed: {str(e)}, using manual connection")
 
     # Manual connection with custom caching
-    cache_key = _generate_cache_key(query, node)
+    cache_key = _generate_cache_key(query, node, params)
 
-    # Check cache
-    if CACHE_ENABLED and cache_key in _query_cache:
+    # Check cache (ttl=0 asks for fresh data, so it skips the lookup as well as the store)
+    if CACHE_ENABLED and ttl > 0 and cache_key in _query_cache:
         cache_entry = _query_cache[cache_key]
         if _is_cache_valid(cache_entry):
-            return cache_entry['data'].copy()
+            return _apply_dtypes(cache_entry['data'].copy(), dtype_backend, dtypes)
         else:
             del _query_cache[cache_key]
 
-    # Fetch from database
+    # Fetch from database on a pooled connection, so repeated fetches (e.g. paging
+    # through the viewer) don't pay a connect + auth handshake each time
+    from python.db.pool import get_pooled_connection
+
     conn = None
     cursor = None
     try:
-        conn = get_db_connection(node)
-        cursor = conn.cursor(dictionary=True)
-        cursor.execute(query)
-        data = cursor.fetchall()
-        result_df = pd.DataFrame(data)
+        conn = get_pooled_connection(node)
+        # Tuple rows in batches avoid building a dict per row before the DataFrame
+        cursor = conn.cursor()
+        cursor.execute(query, params)
+        columns = [col[0] for col in cursor.description] if cursor.description else []
+        rows = []
+        while True:
+            batch = cursor.fetchmany(FETCH_BATCH_SIZE)
+            if not batch:
+                break
+            rows.extend(batch)
+        result_df = pd.DataFrame.from_records(rows, columns=columns)
 
         # Store in cache (skip if ttl=0 to avoid caching fresh queries)
         if CACHE_ENABLED and ttl > 0:
@@ -408,7 +449,7 @@ def fetch_data(query: str, node: int, ttl: int = 9999) -> pd.DataFrame:
                 'node': node
             }
 
-        return result_df
+        return _apply_dtypes(result_df, dtype_backend, dtypes)
 
     except Exception as e:
         config = get_node_config(node)
@@ -422,6 +463,11 @@ def fetch_data(query: str, node: int, ttl: int = 9999) -> pd.DataFrame:
         if cursor:
             cursor.close()
         if conn:
+            # End the read snapshot before the connection goes back to the pool
+            try:
+                conn.rollback()
+            except mysql.connector.Error:
+                pass
             conn.close()
 
 
@@ -448,7 +494,6 @@ def execute_query(query: str, node: int, isolation_level: str = "READ COMMITTED"
         conn = mysql.connector.connect(**config)
         cursor = conn.cursor()
         cursor.execute(f"SET SESSION TRANSACTION ISOLATION LEVEL {isolation_level}")
-        cursor.execute("START TRANSACTION")
         cursor.execute(query)
         conn.commit()
         return cursor.rowcount
@@ -513,17 +558,55 @@ def create_dedicated_connection(node: int, isolation_level: str = "REPEATABLE RE
 # MULTI-NODE UTILITIES
 # ============================================================================
 
+def _ping_node(node: int) -> bool:
+    """
+    Check a node with COM_PING on a pooled connection instead of a fresh connect + SELECT 1.
+
+    Args:
+        node: Node number (1, 2, or 3)
+
+    Returns:
+        True if the node answered, False otherwise
+    """
+    # Lazy import: python.db.pool imports this module
+    from python.db.pool import get_pooled_connection
+
+    try:
+        # Checkout pings the connection (reconnecting it if the server dropped it)
+        conn = get_pooled_connection(node)
+        conn.close()
+        return True
+    except Exception as e:
+        print(f"[DB_CONFIG] Node {node} ping: FAILED - {str(e).splitlines()[0]}")
+        return False
+
+
 def check_connectivity() -> Dict[int, bool]:
     """
     Check connectivity to all nodes.
+    Nodes pinged within the last CONNECTIVITY_TTL seconds reuse that result;
+    the rest are pinged concurrently.
 
     Returns:
         Dictionary mapping node numbers to connectivity status
     """
+    now = time.monotonic()
     status = {}
+    stale = []
     for node in [1, 2, 3]:
-        status[node] = test_connection(node)
-    return status
+        cached = _connectivity_cache.get(node)
+        if cached is not None and now - cached[0] < CONNECTIVITY_TTL:
+            status[node] = cached[1]
+        else:
+            stale.append(node)
+
+    if stale:
+        with ThreadPoolExecutor(max_workers=len(stale)) as executor:
+            for node, is_up in zip(stale, executor.map(_ping_node, stale)):
+                _connectivity_cache[node] = (time.monotonic(), is_up)
+                status[node] = is_up
+
+    return {node: status[node] for node in [1, 2, 3]}
 
 
 def get_max_trans_id_multi_node() -> Dict[str, Any]:
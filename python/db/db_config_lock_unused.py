@@ -45,6 +45,8 @@ def execute_with_lock(query: str, params: tuple, resource_id: str,
     Returns:
         dict with status, affected_rows, and message
     """
+    from python.db.pool import get_pooled_connection
+
     lock_manager = _get_lock_manager(current_node_id)
     conn = None
     cursor = None
@@ -58,11 +60,10 @@ def execute_with_lock(query: str, params: tuple, resource_id: str,
                 'affected_rows': 0
             }
 
-        # Execute the query
-        conn = create_dedicated_connection(target_node, isolation_level)
+        # Execute the query on a pooled connection (the pool sets its isolation level on connect)
+        conn = get_pooled_connection(target_node, isolation_level)
         cursor = conn.cursor()
 
-        cursor.execute("START TRANSACTION")
         cursor.execute(query, params)
         affected_rows = cursor.rowcount
         conn.commit()
@@ -112,6 +113,9 @@ def execute_multi_node_write(query: str, params: tuple, resource_id: str,
     Returns:
         dict with status and results per node
     """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+    from python.db.pool import get_pooled_connection
+
     lock_manager = _get_lock_manager(current_node_id)
     results = {}
 
@@ -124,21 +128,19 @@ def execute_multi_node_write(query: str, params: tuple, resource_id: str,
                 'results': {}
             }
 
-        # Execute on all nodes
-        for node in nodes:
+        def _exec_one(node):
             conn = None
             cursor = None
 
             try:
-                conn = create_dedicated_connection(node, isolation_level)
+                conn = get_pooled_connection(node, isolation_level)
                 cursor = conn.cursor()
 
-                cursor.execute("START TRANSACTION")
                 cursor.execute(query, params)
                 affected_rows = cursor.rowcount
                 conn.commit()
 
-                results[node] = {
+                return {
                     'status': 'success',
                     'affected_rows': affected_rows
                 }
@@ -147,16 +149,9 @@ def execute_multi_node_write(query: str, params: tuple, resource_id: str,
                 if conn:
                     conn.rollback()
 
-                results[node] = {
-                    'status': 'failed',
-                    'error': str(e)
-                }
-
-                # If any node fails, mark overall status as failed
                 return {
                     'status': 'failed',
-                    'error': f'Failed on Node {node}: {e}',
-                    'results': results
+                    'error': str(e)
                 }
 
             finally:
@@ -165,6 +160,21 @@ def execute_multi_node_write(query: str, params: tuple, resource_id: str,
                 if conn:
                     conn.close()
 
+        # Execute on all nodes in parallel; the writes are independent once the locks are held
+        with ThreadPoolExecutor(max_workers=len(nodes)) as executor:
+            futures = {executor.submit(_exec_one, node): node for node in nodes}
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+
+        # If any node fails, mark overall status as failed
+        for node in nodes:
+            if results[node]['status'] == 'failed':
+                return {
+                    'status': 'failed',
+                    'error': f"Failed on Node {node}: {results[node]['error']}",
+                    'results': results
+                }
+
         return {
             'status': 'success',
             'message': f'Query executed successfully on nodes {nodes}',
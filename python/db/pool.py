@@ -0,0 +1,171 @@
+"""
+Connection Pool Module - Pooled MySQL Connections per Node
+
+Keeps one mysql.connector connection pool per (node, isolation level) so write
+paths can check out an already-open connection instead of paying a full
+connect + auth handshake on every button click. Pooled connections go back to
+their pool when close() is called on them.
+"""
+
+import threading
+import time
+from typing import Dict, Tuple
+
+import mysql.connector
+from mysql.connector import pooling
+
+from python.db.db_config import get_node_config, create_dedicated_connection, USE_CLOUD_SQL
+
+# Connections kept open per (node, isolation level) pool
+POOL_SIZE = 8
+
+# Isolation levels that may be formatted into SET SESSION statements
+ISOLATION_LEVELS = frozenset({
+    "READ UNCOMMITTED",
+    "READ COMMITTED",
+    "REPEATABLE READ",
+    "SERIALIZABLE"
+})
+
+# Seconds before retrying a pool whose connections could not be opened
+POOL_RETRY_BACKOFF = 5.0
+
+_pools: Dict[Tuple[int, str], pooling.MySQLConnectionPool] = {}
+_pools_lock = threading.Lock()  # Guards _pool_build_locks only; never held while connecting
+_pool_build_locks: Dict[Tuple[int, str], threading.Lock] = {}
+_pool_failures: Dict[Tuple[int, str], float] = {}  # key -> monotonic time of last failed build
+
+
+def get_pool(node: int, isolation_level: str = "REPEATABLE READ") -> pooling.MySQLConnectionPool:
+    """
+    Get the connection pool for a node and isolation level, creating it on first use.
+
+    Args:
+        node: Node number (1, 2, or 3)
+        isolation_level: Transaction isolation level used by the pool's connections
+
+    Returns:
+        MySQLConnectionPool for the node
+
+    Raises:
+        ValueError: If isolation_level is not a known isolation level
+        Exception: If the pool's connections cannot be opened
+    """
+    if isolation_level not in ISOLATION_LEVELS:
+        raise ValueError(f"Invalid isolation level: {isolation_level}")
+
+    key = (node, isolation_level)
+
+    pool = _pools.get(key)
+    if pool is not None:
+        return pool
+
+    # Build outside the module-wide lock: opening POOL_SIZE connections to an offline
+    # node can take connect_timeout, and checkouts for other nodes must not wait on it
+    with _pools_lock:
+        build_lock = _pool_build_locks.setdefault(key, threading.Lock())
+
+    with build_lock:
+        pool = _pools.get(key)
+        if pool is not None:
+            return pool
+
+        config = get_node_config(node)
+        config_type = "Cloud SQL" if USE_CLOUD_SQL else "Local Docker"
+
+        # Don't retry a node whose pool just failed to open
+        failed_at = _pool_failures.get(key)
+        if failed_at is not None and time.monotonic() - failed_at < POOL_RETRY_BACKOFF:
+            raise Exception(
+                f"Failed to create connection pool for {config_type} database (Node {node})\n"
+                f"Host: {config['host']}:{config['port']}\n"
+                f"Error: node was unreachable less than {POOL_RETRY_BACKOFF:.0f}s ago"
+            )
+
+        try:
+            pool = pooling.MySQLConnectionPool(
+                pool_name=f"node{node}_{isolation_level.replace(' ', '_').lower()}",
+                pool_size=POOL_SIZE,
+                # Keep session settings between checkouts
+                pool_reset_session=False,
+                # Runs on every connect and reconnect, so a session never falls back to the server default
+                init_command=f"SET SESSION TRANSACTION ISOLATION LEVEL {isolation_level}",
+                host=config["host"],
+                port=config["port"],
+                user=config["user"],
+                password=config["password"],
+                database=config["database"],
+                autocommit=False,
+                connect_timeout=10,
+                # Compress the protocol only over the network to Cloud SQL; it costs CPU on local Docker
+                compress=USE_CLOUD_SQL
+            )
+        except mysql.connector.Error as db_err:
+            _pool_failures[key] = time.monotonic()
+            raise Exception(
+                f"Failed to create connection pool for {config_type} database (Node {node})\n"
+                f"Host: {config['host']}:{config['port']}\n"
+                f"Error: {str(db_err)}"
+            )
+
+        print(f"[DB_POOL] Created pool for Node {node} ({isolation_level}, size {POOL_SIZE})")
+        _pool_failures.pop(key, None)
+        _pools[key] = pool
+        return pool
+
+
+def get_pooled_connection(node: int, isolation_level: str = "REPEATABLE READ"):
+    """
+    Check out a connection with the given isolation level from the node's pool.
+    Falls back to a dedicated connection if the pool is exhausted.
+
+    Args:
+        node: Node number (1, 2, or 3)
+        isolation_level: Transaction isolation level
+
+    Returns:
+        MySQL connection with isolation level set; close() returns it to the pool
+
+    Raises:
+        ValueError: If isolation_level is not a known isolation level
+    """
+    try:
+        conn = get_pool(node, isolation_level).get_connection()
+    except mysql.connector.errors.PoolError:
+        print(f"[DB_POOL] Pool for Node {node} exhausted, using a dedicated connection")
+        return create_dedicated_connection(node, isolation_level)
+
+    # Pre-ping: reconnect a connection the server dropped while it sat in the pool
+    # (the pool's init_command sets the isolation level again on reconnect)
+    try:
+        conn.ping(reconnect=True, attempts=1, delay=0)
+    except mysql.connector.Error:
+        conn.close()
+        raise
+
+    return conn
+
+
+def warm_pools(nodes=(1, 2, 3), isolation_level: str = "REPEATABLE READ") -> threading.Thread:
+    """
+    Open the connection pools for the given nodes in a background thread, so the
+    first write after startup doesn't pay for the connection handshakes.
+    Unreachable nodes are skipped; their pool is created on first use instead.
+
+    Args:
+        nodes: Node numbers whose pools should be opened
+        isolation_level: Isolation level of the pools to open
+
+    Returns:
+        The started warm-up thread
+    """
+    def _warm():
+        for node in nodes:
+            try:
+                get_pool(node, isolation_level)
+            except Exception as e:
+                print(f"[DB_POOL] Skipped warming pool for Node {node}: {str(e).splitlines()[0]}")
+
+    thread = threading.Thread(target=_warm, daemon=True)
+    thread.start()
+    return thread
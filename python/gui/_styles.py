@@ -0,0 +1,17 @@
+"""
+Shared page styles for the transaction pages
+"""
+from pathlib import Path
+
+import streamlit as st
+
+
+@st.cache_resource
+def load_stylesheet(name):
+    """Read a stylesheet from the static directory once per process"""
+    return (Path(__file__).parent / "static" / name).read_text()
+
+
+def load_button_css():
+    """Get the shared button stylesheet"""
+    return load_stylesheet("buttons.css")
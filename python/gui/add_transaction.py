@@ -12,7 +12,9 @@ import os
 # Add parent directory to path for imports (fixes Streamlit Cloud deployment)
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
 
-from python.db.db_config import create_dedicated_connection, get_max_trans_id_multi_node
+from python.db.db_config import create_dedicated_connection, get_max_trans_id_multi_node, _query_cache
+from python.gui._styles import load_button_css
+from python.utils.recovery_manager import replicate_transaction, execute_global_recovery
 
 
 def render(get_node_for_account, log_transaction):
@@ -52,28 +54,7 @@ def render(get_node_for_account, log_transaction):
     st.info("The next available trans_id will be automatically fetched and assigned")
 
     # Insert button with custom styling
-    st.markdown("""
-    <style>
-    div.stButton > button {
-        background-color: #4B5C4B;
-        color: white;
-        border-color: #4B5C4B;
-    }
-    div.stButton > button:hover {
-        background-color: #3A4A3A;
-        border-color: #3A4A3A;
-    }
-    /* Rollback button styling */
-    button[data-testid="baseButton-secondary"]:has(p:contains("Rollback")) {
-        background-color: #692727 !important;
-        border-color: #692727 !important;
-    }
-    button[data-testid="baseButton-secondary"]:has(p:contains("Rollback")):hover {
-        background-color: #531F1F !important;
-        border-color: #531F1F !important;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    st.html(load_button_css())
 
     btn_col1, btn_col2, btn_col3 = st.columns(3)
     with btn_col1:
@@ -84,9 +65,10 @@ def render(get_node_for_account, log_transaction):
         rollback_button = st.button("Rollback", type="secondary", use_container_width=True, key="rollback_insert")
 
     if commit_button:
-        from python.utils.recovery_manager import replicate_transaction
-        
-        add_transactions = [t for t in st.session_state.active_transactions if t.get('page') == 'add']
+        # Pair each add transaction with its position in the session lists
+        add_transactions = [
+            (idx, t) for idx, t in enumerate(st.session_state.active_transactions) if t.get('page') == 'add'
+        ]
         if add_transactions:
             try:
                 committed_count = 0
@@ -94,8 +76,7 @@ def render(get_node_for_account, log_transaction):
                 processed_trans_ids = set()  # Track which trans_ids have been processed
 
                 # Process transactions one by one
-                for txn in add_transactions:
-                    idx = st.session_state.active_transactions.index(txn)
+                for idx, txn in add_transactions:
                     indices_to_remove.append(idx)
 
                     conn = st.session_state.transaction_connections[idx]
@@ -301,7 +282,6 @@ def render(get_node_for_account, log_transaction):
                     st.toast(f"{committed_count} transaction(s) committed successfully")
                     
                     # Clear all caches to force refresh of data
-                    from python.db.db_config import _query_cache
                     _query_cache.clear()
                     try:
                         st.cache_data.clear()
@@ -318,15 +298,17 @@ def render(get_node_for_account, log_transaction):
             st.warning("No active INSERT transaction to commit")
 
     if rollback_button:
-        add_transactions = [t for t in st.session_state.active_transactions if t.get('page') == 'add']
+        # Pair each add transaction with its position in the session lists
+        add_transactions = [
+            (idx, t) for idx, t in enumerate(st.session_state.active_transactions) if t.get('page') == 'add'
+        ]
         if add_transactions:
             try:
                 rolled_back_count = 0
                 indices_to_remove = []
 
                 # Collect indices and rollback transactions
-                for txn in add_transactions:
-                    idx = st.session_state.active_transactions.index(txn)
+                for idx, txn in add_transactions:
                     indices_to_remove.append(idx)
 
                     conn = st.session_state.transaction_connections[idx]
@@ -352,7 +334,6 @@ def render(get_node_for_account, log_transaction):
                 st.toast(f"{rolled_back_count} transaction(s) rolled back")
 
                 # Clear all caches and refresh
-                from python.db.db_config import _query_cache
                 _query_cache.clear()
                 try:
                     st.cache_data.clear()
@@ -374,7 +355,6 @@ def render(get_node_for_account, log_transaction):
         try:
             # Step 1: Execute global recovery with checkpoints
             with st.spinner("Processing pending recovery logs..."):
-                from python.utils.recovery_manager import execute_global_recovery
                 recovery_result = execute_global_recovery()
                 
                 if recovery_result.get('lock_acquired', False):
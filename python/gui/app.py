@@ -27,6 +27,8 @@ try:
     from python.db.db_config import fetch_data, execute_query, get_node_config, NODE_USE
     from python.utils.lock_manager import DistributedLockManager
     from python.utils.server_ping import NodePinger
+    from python.db.pool import warm_pools
+    from python.gui._styles import load_stylesheet
     import python.gui.view_transactions as view_transactions
     import python.gui.view_reports as view_reports
     import python.gui.add_transaction as add_transaction
@@ -39,6 +41,8 @@ except ImportError:
     from db.db_config import fetch_data, execute_query, get_node_config, NODE_USE
     from utils.lock_manager import DistributedLockManager
     from utils.server_ping import NodePinger
+    from db.pool import warm_pools
+    from gui._styles import load_stylesheet
     import gui.view_transactions as view_transactions
     import gui.view_reports as view_reports
     import gui.add_transaction as add_transaction
@@ -82,6 +86,15 @@ if 'node_pinger' not in st.session_state:
     st.session_state.node_pinger = NodePinger(interval=5)
     st.session_state.node_pinger.start()
 
+
+@st.cache_resource
+def _warm_connection_pools():
+    """Open the per-node connection pools once per app process, in the background"""
+    return warm_pools()
+
+
+_warm_connection_pools()
+
 # No automatic recovery notifications
 
 # Sidebar
@@ -158,25 +171,13 @@ def main():
         pinger = NodePinger()
         node_status = pinger.ping_all_nodes()
         
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            if node_status.get(1, False):
-                st.success("Node 1 Online")
-            else:
-                st.error("Node 1 Offline")
-                
-        with col2:
-            if node_status.get(2, False):
-                st.success("Node 2 Online")
-            else:
-                st.error("Node 2 Offline")
-                
-        with col3:
-            if node_status.get(3, False):
-                st.success("Node 3 Online")
-            else:
-                st.error("Node 3 Offline")
+        # One element for all three badges instead of a column and alert per node
+        badges = "".join(
+            f'<span class="online">Node {node} Online</span>' if node_status.get(node, False)
+            else f'<span class="offline">Node {node} Offline</span>'
+            for node in [1, 2, 3]
+        )
+        st.html(f'{load_stylesheet("node_status.css")}<div class="node-status">{badges}</div>')
         
         # Recovery system is now manual-only (triggered before each transaction)
 
@@ -12,7 +12,16 @@ import os
 # Add parent directory to path for imports (fixes Streamlit Cloud deployment)
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
 
-from python.db.db_config import fetch_data, create_dedicated_connection
+from python.db.db_config import fetch_data, create_dedicated_connection, _query_cache
+from python.gui._styles import load_button_css
+from python.utils.recovery_manager import replicate_transaction, execute_global_recovery
+
+# Columns the delete page actually uses (account_id for routing, the rest for the previews)
+PREVIEW_COLS = ("trans_id", "account_id", "newdate", "type", "operation", "amount")
+
+# Parameterized statements (values are bound by the driver, never formatted into SQL)
+SEARCH_SQL = f"SELECT {', '.join(PREVIEW_COLS)} FROM trans WHERE trans_id = %s LIMIT 1"
+DELETE_SQL = "DELETE FROM trans WHERE trans_id = %s"
 
 
 def render(get_node_for_account, log_transaction):
@@ -54,14 +63,14 @@ def render(get_node_for_account, log_transaction):
             
             # Search for transaction with Node 1 priority, fallback to other nodes
             found_data = None
-            search_query = f"SELECT * FROM trans WHERE trans_id = {trans_id}"
+            search_params = (trans_id,)
             search_results = []
             
             with st.spinner(f"Searching for transaction {trans_id} across all available nodes (fresh data)..."):
                 # Try Node 1 first with fresh data (ttl=0 to bypass cache)
                 if node_status.get(1, False):
                     try:
-                        found_data = fetch_data(search_query, node=1, ttl=0)  # Force fresh data
+                        found_data = fetch_data(SEARCH_SQL, node=1, ttl=0, params=search_params)  # Force fresh data
                         if not found_data.empty:
                             search_results.append(("Node 1 (Central)", found_data))
                             st.success("Transaction found on Node 1 (central)")
@@ -76,7 +85,7 @@ def render(get_node_for_account, log_transaction):
                 for node in [2, 3]:
                     if node_status.get(node, False):
                         try:
-                            node_data = fetch_data(search_query, node=node, ttl=0)  # Force fresh data
+                            node_data = fetch_data(SEARCH_SQL, node=node, ttl=0, params=search_params)  # Force fresh data
                             if not node_data.empty:
                                 search_results.append((f"Node {node}", node_data))
                                 if found_data is None or found_data.empty:
@@ -172,28 +181,7 @@ def render(get_node_for_account, log_transaction):
     st.warning("This action cannot be undone!")
 
     # Delete button with custom styling
-    st.markdown("""
-    <style>
-    div.stButton > button {
-        background-color: #4B5C4B;
-        color: white;
-        border-color: #4B5C4B;
-    }
-    div.stButton > button:hover {
-        background-color: #3A4A3A;
-        border-color: #3A4A3A;
-    }
-    /* Rollback button styling */
-    button[data-testid="baseButton-secondary"]:has(p:contains("Rollback")) {
-        background-color: #692727 !important;
-        border-color: #692727 !important;
-    }
-    button[data-testid="baseButton-secondary"]:has(p:contains("Rollback")):hover {
-        background-color: #531F1F !important;
-        border-color: #531F1F !important;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    st.html(load_button_css())
 
     btn_col1, btn_col2, btn_col3 = st.columns(3)
     with btn_col1:
@@ -204,17 +192,17 @@ def render(get_node_for_account, log_transaction):
         rollback_button = st.button("Rollback", type="secondary", use_container_width=True, key="rollback_delete")
 
     if commit_button:
-        from python.utils.recovery_manager import replicate_transaction
-        
-        delete_transactions = [t for t in st.session_state.active_transactions if t.get('page') == 'delete']
+        # Pair each delete transaction with its position in the session lists
+        delete_transactions = [
+            (idx, t) for idx, t in enumerate(st.session_state.active_transactions) if t.get('page') == 'delete'
+        ]
         if delete_transactions:
             try:
                 committed_count = 0
                 indices_to_remove = []
 
                 # Process transactions one by one
-                for txn in delete_transactions:
-                    idx = st.session_state.active_transactions.index(txn)
+                for idx, txn in delete_transactions:
                     indices_to_remove.append(idx)
 
                     conn = st.session_state.transaction_connections[idx]
@@ -335,7 +323,6 @@ def render(get_node_for_account, log_transaction):
                     st.toast(f"{committed_count} transaction(s) deleted successfully")
                     
                     # Clear all caches to force refresh of data
-                    from python.db.db_config import _query_cache
                     _query_cache.clear()
                     try:
                         st.cache_data.clear()
@@ -352,15 +339,17 @@ def render(get_node_for_account, log_transaction):
             st.warning("No active DELETE transaction to commit")
 
     if rollback_button:
-        delete_transactions = [t for t in st.session_state.active_transactions if t.get('page') == 'delete']
+        # Pair each delete transaction with its position in the session lists
+        delete_transactions = [
+            (idx, t) for idx, t in enumerate(st.session_state.active_transactions) if t.get('page') == 'delete'
+        ]
         if delete_transactions:
             try:
                 rolled_back_count = 0
                 indices_to_remove = []
 
                 # Collect indices and rollback transactions
-                for txn in delete_transactions:
-                    idx = st.session_state.active_transactions.index(txn)
+                for idx, txn in delete_transactions:
                     indices_to_remove.append(idx)
 
                     conn = st.session_state.transaction_connections[idx]
@@ -386,7 +375,6 @@ def render(get_node_for_account, log_transaction):
                 st.toast(f"{rolled_back_count} transaction(s) rolled back")
 
                 # Clear all caches and refresh
-                from python.db.db_config import _query_cache
                 _query_cache.clear()
                 try:
                     st.cache_data.clear()
@@ -415,7 +403,6 @@ def render(get_node_for_account, log_transaction):
         try:
             # Step 1: Execute global recovery with checkpoints
             with st.spinner("Processing pending recovery logs..."):
-                from python.utils.recovery_manager import execute_global_recovery
                 recovery_result = execute_global_recovery()
                 
                 if recovery_result.get('lock_acquired', False):
@@ -447,13 +434,13 @@ def render(get_node_for_account, log_transaction):
             # Search for transaction with Node 1 priority, fallback to other nodes
             found_data = None
             account_id = None
-            search_query = f"SELECT * FROM trans WHERE trans_id = {trans_id}"
+            search_params = (trans_id,)
             
             with st.spinner(f"Searching for transaction {trans_id} (fresh data)..."):
                 # Try Node 1 first with fresh data
                 if node_status.get(1, False):
                     try:
-                        found_data = fetch_data(search_query, node=1, ttl=0)  # Force fresh data
+                        found_data = fetch_data(SEARCH_SQL, node=1, ttl=0, params=search_params)  # Force fresh data
                         if not found_data.empty:
                             st.info("Transaction found on Node 1 (central)")
                             account_id = int(found_data.iloc[0]['account_id'])
@@ -467,7 +454,7 @@ def render(get_node_for_account, log_transaction):
                     for node in [2, 3]:
                         if node_status.get(node, False):
                             try:
-                                found_data = fetch_data(search_query, node=node, ttl=0)  # Force fresh data
+                                found_data = fetch_data(SEARCH_SQL, node=node, ttl=0, params=search_params)  # Force fresh data
                                 if not found_data.empty:
                                     account_id = int(found_data.iloc[0]['account_id'])
                                     # Check if this creates data inconsistency
@@ -534,9 +521,6 @@ def render(get_node_for_account, log_transaction):
                     })
                 st.dataframe(pd.DataFrame(status_data))
 
-            # Build DELETE query
-            delete_query = f"DELETE FROM trans WHERE trans_id = {trans_id}"
-
             with st.spinner(f"Preparing delete transaction on Node {primary_node}..."):
                 # Create dedicated connection to primary node only
                 conn = create_dedicated_connection(primary_node, isolation_level)
@@ -546,8 +530,10 @@ def render(get_node_for_account, log_transaction):
                 cursor.execute(f"SET TRANSACTION ISOLATION LEVEL {isolation_level}")
                 cursor.execute("START TRANSACTION")
 
-                # Execute delete but don't commit yet
-                cursor.execute(delete_query)
+                # Execute delete but don't commit yet; the driver-escaped statement
+                # text is kept for replication and recovery logs
+                cursor.execute(DELETE_SQL, (trans_id,))
+                delete_query = cursor.statement
 
                 # Store single transaction for commit/rollback
                 st.session_state.transaction_connections.append(conn)
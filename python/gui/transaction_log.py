@@ -5,6 +5,60 @@
 
 # import streamlit as st
 # import pandas as pd
+# import numpy as np
+
+
+# # Test case for each pair of concurrent operations, keyed on the set of operations
+# _READ_CASE = ("📖 Case #1: Concurrent Reads", "blue")
+# _READ_WRITE_CASE = ("🔄 Case #2: Read-Write Conflict", "orange")
+# _WRITE_WRITE_CASE = ("✍️ Case #3: Write-Write Conflict", "red")
+# _WRITE_OPERATIONS = ('INSERT', 'UPDATE', 'DELETE')
+
+# _CASE_MAP = {frozenset({'READ'}): _READ_CASE}
+# for _write_op in _WRITE_OPERATIONS:
+#     _CASE_MAP[frozenset({'READ', _write_op})] = _READ_WRITE_CASE
+#     for _other_write_op in _WRITE_OPERATIONS:
+#         _CASE_MAP[frozenset({_write_op, _other_write_op})] = _WRITE_WRITE_CASE
+
+
+# def _concurrent_pairs(timestamps, window_seconds=5):
+#     """
+#     Sweep-line search for every pair of operations starting within the window.
+#     timestamps must be sorted. Returns (first, second, gap_seconds) arrays
+#     covering all overlapping pairs, not only adjacent ones.
+#     """
+#     n = len(timestamps)
+#     window = np.timedelta64(window_seconds, 's')
+
+#     # Earliest operation still inside the window of each operation
+#     left = np.searchsorted(timestamps, timestamps - window, side='right')
+#     counts = np.arange(n) - left
+
+#     # Expand each operation into one pair per earlier operation in its window
+#     second = np.repeat(np.arange(n), counts)
+#     offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+#     first = np.repeat(left, counts) + offsets
+
+#     gaps = (timestamps[second] - timestamps[first]) / np.timedelta64(1, 's')
+#     return first, second, gaps
+
+
+# def _prepare_log_df(transaction_log):
+#     """
+#     Return the transaction log as a timestamp-sorted DataFrame.
+#     The log is append-only, so the parsed frame is reused across reruns
+#     until new entries are logged.
+#     """
+#     cached = st.session_state.get('_parsed_transaction_log')
+#     if cached is not None and cached[0] == len(transaction_log):
+#         return cached[1]
+
+#     log_df = pd.DataFrame(transaction_log)
+#     log_df['timestamp'] = pd.to_datetime(log_df['timestamp'])
+#     log_df = log_df.sort_values('timestamp')
+
+#     st.session_state['_parsed_transaction_log'] = (len(transaction_log), log_df)
+#     return log_df
 
 
 # def render():
@@ -22,58 +76,52 @@
 #         st.info("ℹ️ No transactions logged yet. Perform some operations first!")
 #     else:
 #         # Display log
-#         log_df = pd.DataFrame(st.session_state.transaction_log)
+#         log_df = _prepare_log_df(st.session_state.transaction_log)
 
 #         st.subheader("All Transactions")
-#         st.dataframe(log_df, use_container_width=True)
+#         st.dataframe(log_df.sort_index(), use_container_width=True)
 
 #         # Analyze concurrency
 #         st.markdown("---")
 #         st.subheader("🔍 Concurrency Analysis")
 
-#         # Find concurrent operations
-#         log_df['timestamp'] = pd.to_datetime(log_df['timestamp'])
-#         log_df = log_df.sort_values('timestamp')
-
 #         # Detect overlapping transactions (within 5 seconds = concurrent)
 #         st.markdown("### Detected Concurrent Operations")
 
+#         ops = log_df['operation'].to_numpy()
+#         nodes = log_df['node'].to_numpy()
+#         timestamps = log_df['timestamp'].to_numpy()
+
+#         # All pairs within 5 seconds = concurrent
+#         firsts, seconds, gaps = _concurrent_pairs(timestamps)
+
 #         concurrent_found = False
-#         for i in range(len(log_df) - 1):
-#             time_diff = (log_df.iloc[i+1]['timestamp'] - log_df.iloc[i]['timestamp']).total_seconds()
-
-#             if time_diff < 5:  # Within 5 seconds = concurrent
-#                 concurrent_found = True
-#                 op1 = log_df.iloc[i]
-#                 op2 = log_df.iloc[i+1]
-
-#                 # Determine test case
-#                 if op1['operation'] == 'READ' and op2['operation'] == 'READ':
-#                     case = "📖 Case #1: Concurrent Reads"
-#                     color = "blue"
-#                 elif (op1['operation'] == 'READ' and op2['operation'] in ['INSERT', 'UPDATE', 'DELETE']) or \
-#                      (op2['operation'] == 'READ' and op1['operation'] in ['INSERT', 'UPDATE', 'DELETE']):
-#                     case = "🔄 Case #2: Read-Write Conflict"
-#                     color = "orange"
-#                 elif op1['operation'] in ['INSERT', 'UPDATE', 'DELETE'] and op2['operation'] in ['INSERT', 'UPDATE', 'DELETE']:
-#                     case = "✍️ Case #3: Write-Write Conflict"
-#                     color = "red"
-
-#                 with st.container(border=True):
-#                     st.markdown(f"**{case}**")
-#                     col1, col2 = st.columns(2)
-
-#                     with col1:
-#                         st.write(f"**Operation 1**: {op1['operation']}")
-#                         st.write(f"Node: {op1['node']}")
-#                         st.write(f"Time: {op1['timestamp']}")
-
-#                     with col2:
-#                         st.write(f"**Operation 2**: {op2['operation']}")
-#                         st.write(f"Node: {op2['node']}")
-#                         st.write(f"Time: {op2['timestamp']}")
-
-#                     st.write(f"⏱️ Time difference: {time_diff:.2f}s")
+#         for i, j, time_diff in zip(firsts, seconds, gaps):
+#             op1 = {'operation': ops[i], 'node': nodes[i], 'timestamp': pd.Timestamp(timestamps[i])}
+#             op2 = {'operation': ops[j], 'node': nodes[j], 'timestamp': pd.Timestamp(timestamps[j])}
+
+#             # Determine test case
+#             case, color = _CASE_MAP.get(frozenset({op1['operation'], op2['operation']}), (None, None))
+#             if case is None:
+#                 continue
+
+#             concurrent_found = True
+
+#             with st.container(border=True):
+#                 st.markdown(f"**{case}**")
+#                 col1, col2 = st.columns(2)
+
+#                 with col1:
+#                     st.write(f"**Operation 1**: {op1['operation']}")
+#                     st.write(f"Node: {op1['node']}")
+#                     st.write(f"Time: {op1['timestamp']}")
+
+#                 with col2:
+#                     st.write(f"**Operation 2**: {op2['operation']}")
+#                     st.write(f"Node: {op2['node']}")
+#                     st.write(f"Time: {op2['timestamp']}")
+
+#                 st.write(f"⏱️ Time difference: {time_diff:.2f}s")
 
 #         if not concurrent_found:
 #             st.info("ℹ️ No concurrent operations detected yet. Try performing operations within 5 seconds of each other.")
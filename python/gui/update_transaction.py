@@ -6,13 +6,254 @@ This module contains the original logic for updating transactions.
 import streamlit as st
 import pandas as pd
 import time
+from datetime import datetime
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Add parent directory to path for imports (fixes Streamlit Cloud deployment)
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
 
-from python.db.db_config import fetch_data, create_dedicated_connection
+from python.db.db_config import fetch_data, _query_cache
+from python.db.pool import get_pooled_connection
+from python.gui._styles import load_button_css
+from python.utils.recovery_manager import replicate_transactions_batch, execute_global_recovery
+
+# Columns the update page actually uses (account_id for routing, the rest for the previews)
+PREVIEW_COLS = ("trans_id", "account_id", "newdate", "type", "operation", "amount")
+
+# Parameterized statements (values are bound by the driver, never formatted into SQL)
+SEARCH_SQL = f"SELECT {', '.join(PREVIEW_COLS)} FROM trans WHERE trans_id = %s LIMIT 1"
+PREVIEW_SQL = f"SELECT {', '.join(PREVIEW_COLS)} FROM trans WHERE trans_id = %s"
+UPDATE_SQL = "UPDATE trans SET amount = %s, type = %s, operation = %s WHERE trans_id = %s"
+# Row read (and locked) inside the update's own transaction before the UPDATE runs
+LOCK_ROW_SQL = f"{SEARCH_SQL} FOR UPDATE"
+
+# Seconds a previewed row can be reused by the Update button instead of searching again
+PREVIEW_CACHE_TTL = 5
+
+# Node status table layout; only the Status and Role cells change between clicks
+_STATUS_TEMPLATE = pd.DataFrame({
+    'Node': ["Node 1", "Node 2", "Node 3"],
+    'Status': ["", "", ""],
+    'Role': ["", "", ""]
+})
+
+# Seconds after which an in-flight button action is treated as abandoned
+# (longer than the 30s lock acquire timeout)
+INFLIGHT_TIMEOUT = 60
+
+
+def _search_transaction(trans_id, node_status):
+    """
+    Look up a transaction on the online partition nodes (2 and 3) concurrently and
+    return the first hit. Only used to route an update while Node 1 (central) is offline.
+
+    Args:
+        trans_id: Transaction ID to search for
+        node_status: Node status dictionary {node_id: is_online}
+
+    Returns:
+        tuple: (found_node, found_data, errors) - found_node/found_data are None if
+               no node has the transaction; errors is a list of (node, message)
+    """
+    candidates = [node for node in [2, 3] if node_status.get(node, False)]
+    if not candidates:
+        return None, None, []
+
+    errors = []
+    executor = ThreadPoolExecutor(max_workers=len(candidates))
+    futures = {
+        executor.submit(fetch_data, SEARCH_SQL, node, 0, (trans_id,)): node
+        for node in candidates
+    }
+
+    try:
+        for future in as_completed(futures):
+            node = futures[future]
+            try:
+                data = future.result()
+            except Exception as e:
+                errors.append((node, str(e)))
+                continue
+
+            if not data.empty:
+                return node, data, errors
+
+        return None, None, errors
+
+    finally:
+        # Don't wait on slower nodes once we have an answer
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+@st.cache_data(ttl=2)
+def _node_status_frame(status_tuple, primary_node, partition_node):
+    """
+    Build the node status table for a cluster state.
+    Identical states within the TTL reuse the same frame.
+
+    Args:
+        status_tuple: Online flags for Nodes 1, 2 and 3
+        primary_node: Node the update is prepared on
+        partition_node: Natural partition node for the account
+
+    Returns:
+        DataFrame with Node, Status and Role columns
+    """
+    statuses = []
+    roles = []
+    for node, is_online in zip([1, 2, 3], status_tuple):
+        if node == primary_node:
+            role = "Primary (Active)"
+        elif node == 1 and not is_online:
+            role = "Central (Offline - will recover)"
+        elif node == partition_node and node != primary_node:
+            if is_online:
+                role = "Partition (Standby)"
+            else:
+                role = "Partition (Offline - will recover)"
+        else:
+            role = "Replica" if is_online else "Offline (will recover)"
+
+        statuses.append('Online' if is_online else 'Offline')
+        roles.append(role)
+
+    df = _STATUS_TEMPLATE.copy(deep=False)
+    df['Status'] = statuses
+    df['Role'] = roles
+    return df
+
+
+def _prepare_update_with_read(node, isolation_level, trans_id, update_params):
+    """
+    Read a transaction's row and prepare its UPDATE in one transaction on a node,
+    without committing. The row is read with FOR UPDATE, so it can't change or
+    disappear between the read and the write.
+
+    Args:
+        node: Node to prepare the update on
+        isolation_level: Transaction isolation level
+        trans_id: Transaction ID to update
+        update_params: Values bound to UPDATE_SQL
+
+    Returns:
+        tuple: (conn, cursor, statement, found_data) - found_data is the row as it was
+               before the update; all four are None if the node has no such transaction
+               (its transaction is rolled back and the connection returned to the pool)
+    """
+    conn = get_pooled_connection(node, isolation_level)
+    cursor = conn.cursor()
+
+    try:
+        cursor.execute("START TRANSACTION")
+
+        cursor.execute(LOCK_ROW_SQL, (trans_id,))
+        rows = cursor.fetchall()
+        if not rows:
+            conn.rollback()
+            cursor.close()
+            conn.close()
+            return None, None, None, None
+        found_data = pd.DataFrame.from_records(rows, columns=PREVIEW_COLS)
+
+        # Execute the write but don't commit yet
+        cursor.execute(UPDATE_SQL, update_params)
+        return conn, cursor, cursor.statement, found_data
+
+    except Exception:
+        try:
+            conn.rollback()
+            cursor.close()
+            conn.close()
+        except Exception:
+            pass
+        raise
+
+
+def _release_lock(lock_manager, resource_id, background=False):
+    """
+    Release a transaction's distributed lock on all nodes (2PL shrinking phase).
+
+    Args:
+        lock_manager: DistributedLockManager holding the lock
+        resource_id: Locked resource
+        background: Release on a background worker instead of waiting for every node
+
+    Returns:
+        Result of release_multi_node_lock, or a Future when released in the background
+    """
+    if not background:
+        return lock_manager.release_multi_node_lock(resource_id, nodes=[1, 2, 3])
+
+    # The lock manager keeps the release pending until it finishes, so re-locking the
+    # resource waits for it instead of racing it
+    future = lock_manager.release_multi_node_lock_async(resource_id, [1, 2, 3])
+    future.add_done_callback(lambda f: _log_release_result(f, resource_id))
+    return future
+
+
+def _log_release_result(future, resource_id):
+    """Log a background lock release that failed or released nothing"""
+    error = future.exception()
+    if error is not None:
+        print(f"[UPDATE_TRANSACTION] Background lock release failed for {resource_id}: {error}")
+    elif not future.result():
+        print(f"[UPDATE_TRANSACTION] Background lock release for {resource_id} released no locks")
+
+
+def _begin_action(action):
+    """
+    Mark a button action as in flight so a repeated click can't run it twice.
+
+    Args:
+        action: Action name used for the session state keys (e.g. "update")
+
+    Returns:
+        int: Token for this run, or None if the action is already in flight
+    """
+    inflight = st.session_state.get(f"{action}_inflight")
+    if inflight and time.monotonic() - inflight['started'] < INFLIGHT_TIMEOUT:
+        return None
+
+    # Monotonic token tells an abandoned run apart from a fresh click
+    token = st.session_state.get(f"{action}_token", 0) + 1
+    st.session_state[f"{action}_token"] = token
+    st.session_state[f"{action}_inflight"] = {'token': token, 'started': time.monotonic()}
+    return token
+
+
+def _end_action(action, token):
+    """
+    Clear the in-flight flag for a button action if it still belongs to this run.
+
+    Args:
+        action: Action name passed to _begin_action
+        token: Token returned by _begin_action
+    """
+    inflight = st.session_state.get(f"{action}_inflight")
+    if inflight and inflight['token'] == token:
+        del st.session_state[f"{action}_inflight"]
+
+
+def _remove_transactions(indices):
+    """
+    Drop finished transactions from the session's parallel transaction lists.
+    The lists are rebuilt in one pass rather than deleted from index by index.
+
+    Args:
+        indices: Positions of the transactions to remove
+    """
+    removed = set(indices)
+    keep = [i for i in range(len(st.session_state.active_transactions)) if i not in removed]
+
+    active = st.session_state.active_transactions
+    connections = st.session_state.transaction_connections
+    cursors = st.session_state.transaction_cursors
+
+    st.session_state.active_transactions = [active[i] for i in keep]
+    st.session_state.transaction_connections = [connections[i] for i in keep]
+    st.session_state.transaction_cursors = [cursors[i] for i in keep]
 
 
 def render(get_node_for_account, log_transaction):
@@ -29,6 +270,22 @@ def render(get_node_for_account, log_transaction):
     Modify an existing transaction record. Updates are applied to the target node.
     """)
 
+    # Button styling
+    st.html(load_button_css())
+
+    _update_form(get_node_for_account, log_transaction)
+
+
+@st.fragment
+def _update_form(get_node_for_account, log_transaction):
+    """
+    Render the update form and its buttons.
+    Runs as a fragment so widget interactions only rerun this part of the page.
+
+    Args:
+        get_node_for_account: Function to determine which node to use based on account_id
+        log_transaction: Function to log transactions
+    """
     st.subheader("Update Transaction")
 
     col1, col2 = st.columns(2)
@@ -49,47 +306,23 @@ def render(get_node_for_account, log_transaction):
     if preview_button:
         try:
             # Clear cache before fetching to get fresh data
-            from python.db.db_config import _query_cache
             _query_cache.clear()
 
             # Search for transaction on Node 1 (central node) with ttl=0 to force fresh data
-            search_query = f"SELECT * FROM trans WHERE trans_id = {trans_id}"
-            found_data = fetch_data(search_query, node=1, ttl=0)
+            found_data = fetch_data(PREVIEW_SQL, node=1, ttl=0, params=(trans_id,))
 
             if found_data.empty:
                 st.warning(f"Transaction ID {trans_id} not found")
             else:
-                from datetime import datetime
+                # Remember the row so an Update click right after can skip the search
+                st.session_state.preview_cache = {"trans_id": trans_id, "data": found_data, "ts": time.time()}
+
                 st.success(f"Found transaction (refreshed at {datetime.now().strftime('%H:%M:%S')})")
                 st.dataframe(found_data)
 
         except Exception as e:
             st.error(f"Error searching: {str(e)}")
 
-    # Update button with custom styling
-    st.markdown("""
-    <style>
-    div.stButton > button {
-        background-color: #4B5C4B;
-        color: white;
-        border-color: #4B5C4B;
-    }
-    div.stButton > button:hover {
-        background-color: #3A4A3A;
-        border-color: #3A4A3A;
-    }
-    /* Rollback button styling */
-    button[data-testid="baseButton-secondary"]:has(p:contains("Rollback")) {
-        background-color: #692727 !important;
-        border-color: #692727 !important;
-    }
-    button[data-testid="baseButton-secondary"]:has(p:contains("Rollback")):hover {
-        background-color: #531F1F !important;
-        border-color: #531F1F !important;
-    }
-    </style>
-    """, unsafe_allow_html=True)
-
     btn_col1, btn_col2, btn_col3 = st.columns(3)
     with btn_col1:
         update_button = st.button("Update Transaction", type="primary", use_container_width=True)
@@ -99,17 +332,22 @@ def render(get_node_for_account, log_transaction):
         rollback_button = st.button("Rollback", type="secondary", use_container_width=True, key="rollback_update")
 
     if commit_button:
-        from python.utils.recovery_manager import replicate_transaction
-        
-        update_transactions = [t for t in st.session_state.active_transactions if t.get('page') == 'update']
+        # Pair each update transaction with its position in the session lists
+        update_transactions = [
+            (idx, t) for idx, t in enumerate(st.session_state.active_transactions) if t.get('page') == 'update'
+        ]
         if update_transactions:
+            commit_token = _begin_action("commit")
+            if commit_token is None:
+                st.warning("A commit is already in progress - please wait for it to finish")
+                st.stop()
+
             try:
                 committed_count = 0
                 indices_to_remove = []
 
                 # Process transactions one by one
-                for txn in update_transactions:
-                    idx = st.session_state.active_transactions.index(txn)
+                for idx, txn in update_transactions:
                     indices_to_remove.append(idx)
 
                     conn = st.session_state.transaction_connections[idx]
@@ -134,56 +372,60 @@ def render(get_node_for_account, log_transaction):
                         
                         st.info(f"Transaction updated on Node {primary_node}")
                         
-                        # Get current node status for replication decisions
-                        current_node_status = st.session_state.node_pinger.get_status()
-                        partition_node_for_account = get_node_for_account(account_id)
+                        partition_node_for_account = txn['partition_node']
                         
                         # Determine replication targets based on primary node
-                        replication_results = []
+                        replication_targets = []
                         
                         if primary_node == 1:
                             # Primary is Node 1: replicate to partition node
-                            target_node = partition_node_for_account
-                            if target_node != 1:
-                                with st.spinner(f"Replicating to Node {target_node} (partition node)..."):
-                                    result = replicate_transaction(query, primary_node, target_node, isolation_level)
-                                    replication_results.append((target_node, result))
+                            if partition_node_for_account != 1:
+                                replication_targets.append(partition_node_for_account)
                                 
                         else:
                             # Primary is Node 2/3: replicate to Node 1 (and potentially other nodes)
                             # Always try to replicate to Node 1 (central)
-                            with st.spinner(f"Replicating to Node 1 (central)..."):
-                                result = replicate_transaction(query, primary_node, 1, isolation_level)
-                                replication_results.append((1, result))
+                            replication_targets.append(1)
                             
                             # If primary is not the natural partition node, also replicate to partition node
                             if primary_node != partition_node_for_account and partition_node_for_account != 1:
-                                with st.spinner(f"Replicating to Node {partition_node_for_account} (partition node)..."):
-                                    result = replicate_transaction(query, primary_node, partition_node_for_account, isolation_level)
-                                    replication_results.append((partition_node_for_account, result))
+                                replication_targets.append(partition_node_for_account)
                         
-                        # Display replication results
-                        successful_replications = 0
-                        failed_replications = 0
-                        
-                        for target_node, result in replication_results:
-                            if result['status'] == 'error':
-                                st.error(f"Replication to Node {target_node} failed: {result['message']}")
-                                if result['logged']:
-                                    st.warning(f"Recovery logged: {result['recovery_action']}")
+                        # Replicate to all targets concurrently (wall time = slowest node, not the sum)
+                        # Results stream into a single status container as each node finishes
+                        if replication_targets:
+                            target_list = ', '.join(f"Node {node}" for node in replication_targets)
+                            successful_replications = 0
+                            failed_replications = 0
+                            
+                            with st.status(f"Replicating to {target_list}...", expanded=False) as status:
+                                for target_node, result in replicate_transactions_batch(
+                                    query, primary_node, replication_targets, isolation_level
+                                ):
+                                    if result['status'] == 'error':
+                                        status.write(f"❌ Replication to Node {target_node} failed: {result['message']}")
+                                        if result['logged']:
+                                            status.write(f"Recovery logged: {result['recovery_action']}")
+                                        else:
+                                            status.write(f"Recovery logging failed: {result['recovery_action']}")
+                                        failed_replications += 1
+                                    else:
+                                        status.write(f"✅ Successfully replicated to Node {target_node}")
+                                        successful_replications += 1
+                                
+                                # Replication summary
+                                total_replications = len(replication_targets)
+                                if failed_replications > 0:
+                                    status.update(
+                                        label=f"Replicated {successful_replications}/{total_replications} - {failed_replications} failed (logged for recovery)",
+                                        state="error",
+                                        expanded=True
+                                    )
                                 else:
-                                    st.error(f"Recovery logging failed: {result['recovery_action']}")
-                                failed_replications += 1
-                            else:
-                                st.success(f"Successfully replicated to Node {target_node}")
-                                successful_replications += 1
-                        
-                        # Show replication summary
-                        if replication_results:
-                            if failed_replications > 0:
-                                st.info(f"Replication Summary: {successful_replications} successful, {failed_replications} failed (logged for recovery)")
-                            else:
-                                st.success(f"All replications successful ({successful_replications}/{len(replication_results)})")
+                                    status.update(
+                                        label=f"All replications successful ({successful_replications}/{total_replications})",
+                                        state="complete"
+                                    )
                         
                         # Log successful transaction
                         duration = time.time() - txn['start_time']
@@ -207,22 +449,22 @@ def render(get_node_for_account, log_transaction):
                             pass
                     finally:
                         # 2PL SHRINKING PHASE: Release lock after commit and replication complete
+                        # (the outcome is already final, so the UI doesn't wait on the release)
                         if lock_acquired:
-                            st.session_state.lock_manager.release_multi_node_lock(resource_id, nodes=[1, 2, 3])
-                            st.info("Lock released (2PL shrinking phase)")
+                            _release_lock(st.session_state.lock_manager, resource_id, background=True)
+                            st.info("Lock release started (2PL shrinking phase)")
 
                 # Remove processed transactions
-                for idx in sorted(indices_to_remove, reverse=True):
-                    del st.session_state.active_transactions[idx]
-                    del st.session_state.transaction_connections[idx]
-                    del st.session_state.transaction_cursors[idx]
+                _remove_transactions(indices_to_remove)
 
                 if committed_count > 0:
+                    # Previewed row is stale once the update is committed
+                    st.session_state.pop('preview_cache', None)
+
                     st.success(f"{committed_count} update transaction(s) committed successfully!")
                     st.toast(f"{committed_count} transaction(s) committed successfully")
                     
                     # Clear all caches to force refresh of data
-                    from python.db.db_config import _query_cache
                     _query_cache.clear()
 
                     # Clear Streamlit's connection cache
@@ -237,19 +479,28 @@ def render(get_node_for_account, log_transaction):
 
             except Exception as e:
                 st.error(f"Update commit process failed: {str(e)}")
+            finally:
+                _end_action("commit", commit_token)
         else:
             st.warning("No active UPDATE transaction to commit")
 
     if rollback_button:
-        update_transactions = [t for t in st.session_state.active_transactions if t.get('page') == 'update']
+        # Pair each update transaction with its position in the session lists
+        update_transactions = [
+            (idx, t) for idx, t in enumerate(st.session_state.active_transactions) if t.get('page') == 'update'
+        ]
         if update_transactions:
+            rollback_token = _begin_action("rollback")
+            if rollback_token is None:
+                st.warning("A rollback is already in progress - please wait for it to finish")
+                st.stop()
+
             try:
                 rolled_back_count = 0
                 indices_to_remove = []
 
                 # Collect indices and rollback transactions
-                for txn in update_transactions:
-                    idx = st.session_state.active_transactions.index(txn)
+                for idx, txn in update_transactions:
                     indices_to_remove.append(idx)
 
                     conn = st.session_state.transaction_connections[idx]
@@ -261,21 +512,19 @@ def render(get_node_for_account, log_transaction):
                     # Release lock on rollback (2PL abort - release all locks)
                     if txn.get('lock_acquired', False):
                         resource_id = txn.get('resource_id', f"trans_{txn.get('trans_id')}")
-                        st.session_state.lock_manager.release_multi_node_lock(resource_id, nodes=[1, 2, 3])
+                        _release_lock(st.session_state.lock_manager, resource_id)
                     
                     rolled_back_count += 1
 
-                # Remove in reverse order to maintain correct indices
-                for idx in sorted(indices_to_remove, reverse=True):
-                    del st.session_state.active_transactions[idx]
-                    del st.session_state.transaction_connections[idx]
-                    del st.session_state.transaction_cursors[idx]
+                # Remove rolled back transactions
+                _remove_transactions(indices_to_remove)
+
+                st.session_state.pop('preview_cache', None)
 
                 st.info(f"{rolled_back_count} update transaction(s) rolled back - no changes made or logged")
                 st.toast(f"{rolled_back_count} transaction(s) rolled back")
 
                 # Clear all caches and refresh
-                from python.db.db_config import _query_cache
                 _query_cache.clear()
                 try:
                     st.cache_data.clear()
@@ -286,10 +535,17 @@ def render(get_node_for_account, log_transaction):
 
             except Exception as e:
                 st.error(f"Rollback failed: {str(e)}")
+            finally:
+                _end_action("rollback", rollback_token)
         else:
             st.warning("No active UPDATE transaction to rollback")
 
     if update_button:
+        update_token = _begin_action("update")
+        if update_token is None:
+            st.warning("An update is already in progress - please wait for it to finish")
+            st.stop()
+
         start_time = time.time()
         lock_acquired = False
         resource_id = f"trans_{trans_id}"  # Lock specific to this transaction
@@ -297,7 +553,6 @@ def render(get_node_for_account, log_transaction):
         try:
             # Step 1: Execute global recovery with checkpoints
             with st.spinner("Processing pending recovery logs..."):
-                from python.utils.recovery_manager import execute_global_recovery
                 recovery_result = execute_global_recovery()
                 
                 if recovery_result.get('lock_acquired', False):
@@ -314,55 +569,43 @@ def render(get_node_for_account, log_transaction):
                     st.info("Recovery already running by another process")
             
             # Step 2: Check node status using server pinger
+            # (snapshot of the background pinger's last probe - read once and reused below)
             node_status = st.session_state.node_pinger.get_status()
             
-            # Acquire distributed lock across all available nodes before updating
-            with st.spinner(f"Acquiring distributed lock on transaction {trans_id}..."):
-                lock_acquired = st.session_state.lock_manager.acquire_multi_node_lock(
-                    resource_id, nodes=[1, 2, 3], timeout=30
-                )
-
-                if not lock_acquired:
-                    st.error(f"Failed to acquire lock on transaction {trans_id}. Another user may be modifying it. Please try again.")
-                    st.stop()
-
-            # Search for transaction with Node 1 priority, fallback to other nodes
+            # A fresh Preview of the same transaction or a search only resolves account_id
+            # for routing; the row itself is always read under the lock when preparing
             found_data = None
             account_id = None
-            search_query = f"SELECT * FROM trans WHERE trans_id = {trans_id}"
+            preview_cache = st.session_state.get('preview_cache')
             
-            with st.spinner(f"Searching for transaction {trans_id}..."):
-                # Try Node 1 first with ttl=0 to force fresh data
-                if node_status.get(1, False):
-                    try:
-                        found_data = fetch_data(search_query, node=1, ttl=0)
-                        if not found_data.empty:
-                            st.info("Transaction found on Node 1 (central)")
-                            account_id = int(found_data.iloc[0]['account_id'])
-                    except Exception as e:
-                        st.warning(f"Could not search Node 1: {str(e)}")
-                
-                # If not found on Node 1 or Node 1 is offline, search other nodes
-                if found_data is None or found_data.empty:
-                    for node in [2, 3]:
-                        if node_status.get(node, False):
-                            try:
-                                found_data = fetch_data(search_query, node=node, ttl=0)
-                                if not found_data.empty:
-                                    st.info(f"Transaction found on Node {node}")
-                                    account_id = int(found_data.iloc[0]['account_id'])
-                                    break
-                            except Exception as e:
-                                st.warning(f"Could not search Node {node}: {str(e)}")
-                
-                if found_data is None or found_data.empty:
-                    st.error(f"Transaction ID {trans_id} not found on any available node")
-                    st.stop()
-
-            # Show current node status
-            partition_node = get_node_for_account(account_id)
+            if (preview_cache and preview_cache['trans_id'] == trans_id
+                    and time.time() - preview_cache['ts'] < PREVIEW_CACHE_TTL):
+                found_data = preview_cache['data']
+                account_id = int(found_data.iloc[0]['account_id'])
+                st.info("Using transaction from preview")
             
+            # With Node 1 (central) online it is the primary whatever the account,
+            # so routing needs no search
+            routed_without_search = found_data is not None or node_status.get(1, False)
+            
+            # Otherwise search the online partition nodes at once
+            if not routed_without_search:
+                with st.spinner(f"Searching for transaction {trans_id}..."):
+                    found_node, found_data, search_errors = _search_transaction(trans_id, node_status)
+                    
+                    for node, error in search_errors:
+                        st.warning(f"Could not search Node {node}: {error}")
+                    
+                    if found_data is None:
+                        st.error(f"Transaction ID {trans_id} not found on any available node")
+                        st.stop()
+                    
+                    st.info(f"Transaction found on Node {found_node}")
+                    account_id = int(found_data.iloc[0]['account_id'])
+
             # Determine primary node (Node 1 priority, fallback logic)
+            partition_node = None if account_id is None else get_node_for_account(account_id)
+            
             if node_status.get(1, False):  # Node 1 is online
                 primary_node = 1
                 st.info("Using Node 1 (Central) as primary node")
@@ -383,50 +626,38 @@ def render(get_node_for_account, log_transaction):
                 else:
                     st.error(f"Both Node 1 and Node {partition_node} are offline - Using Node {primary_node} as emergency primary")
             
-            # Show node status
-            with st.expander("Current Node Status"):
-                status_data = []
-                for node in [1, 2, 3]:
-                    is_online = node_status.get(node, False)
-                    if node == primary_node:
-                        role = "Primary (Active)"
-                    elif node == 1 and not is_online:
-                        role = "Central (Offline - will recover)"
-                    elif node == partition_node and node != primary_node:
-                        if is_online:
-                            role = "Partition (Standby)"
-                        else:
-                            role = "Partition (Offline - will recover)"
-                    else:
-                        role = "Replica" if is_online else "Offline (will recover)"
-                    
-                    status_data.append({
-                        'Node': f"Node {node}",
-                        'Status': 'Online' if is_online else 'Offline',
-                        'Role': role
-                    })
-                st.dataframe(pd.DataFrame(status_data))
-
-            # Build UPDATE query
-            update_query = f"""
-            UPDATE trans 
-            SET amount = {new_amount}, 
-                type = '{new_type}', 
-                operation = '{new_operation}'
-            WHERE trans_id = {trans_id}
-            """
+            # Acquire distributed lock across all available nodes right before the write,
+            # so the lock is only held from prepare to commit/rollback. A preview or search
+            # above ran unlocked, so it only picks the primary node (account_id never
+            # changes on UPDATE); the row is re-read with FOR UPDATE below.
+            with st.spinner(f"Acquiring distributed lock on transaction {trans_id}..."):
+                lock_acquired = st.session_state.lock_manager.acquire_multi_node_lock(
+                    resource_id, nodes=[1, 2, 3], timeout=30
+                )
 
-            with st.spinner(f"Preparing update transaction on Node {primary_node}..."):
-                # Create dedicated connection to primary node only
-                conn = create_dedicated_connection(primary_node, isolation_level)
-                cursor = conn.cursor(dictionary=True)
+                if not lock_acquired:
+                    st.error(f"Failed to acquire lock on transaction {trans_id}. Another user may be modifying it. Please try again.")
+                    st.stop()
 
-                # Set isolation level and start transaction
-                cursor.execute(f"SET TRANSACTION ISOLATION LEVEL {isolation_level}")
-                cursor.execute("START TRANSACTION")
+            # UPDATE parameters (bound to UPDATE_SQL by the driver)
+            update_params = (new_amount, new_type, new_operation, trans_id)
 
-                # Execute update but don't commit yet
-                cursor.execute(update_query)
+            with st.spinner(f"Preparing update transaction on Node {primary_node}..."):
+                # Prepare on primary node only; other nodes receive it through replication on commit.
+                # The row is read with FOR UPDATE in the same transaction, so a delete that
+                # committed since the preview/search is caught here instead of updating 0 rows.
+                conn, cursor, update_query, found_data = _prepare_update_with_read(
+                    primary_node, isolation_level, trans_id, update_params
+                )
+                
+                if found_data is None:
+                    st.error(f"Transaction ID {trans_id} not found on Node {primary_node}")
+                    _release_lock(st.session_state.lock_manager, resource_id)
+                    lock_acquired = False
+                    st.stop()
+                
+                account_id = int(found_data.iloc[0]['account_id'])
+                partition_node = get_node_for_account(account_id)
 
                 # Store single transaction for commit/rollback
                 st.session_state.transaction_connections.append(conn)
@@ -437,6 +668,7 @@ def render(get_node_for_account, log_transaction):
                     'operation': 'UPDATE',
                     'trans_id': trans_id,
                     'account_id': account_id,
+                    'partition_node': partition_node,  # Routing computed once at update time
                     'query': update_query,
                     'isolation_level': isolation_level,
                     'start_time': start_time,
@@ -444,6 +676,15 @@ def render(get_node_for_account, log_transaction):
                     'resource_id': resource_id  # Store resource_id for lock release
                 })
 
+            # Show node status
+            with st.expander("Current Node Status"):
+                status_tuple = tuple(node_status.get(node, False) for node in [1, 2, 3])
+                st.dataframe(
+                    _node_status_frame(status_tuple, primary_node, partition_node),
+                    use_container_width=True,
+                    hide_index=True
+                )
+
             duration = time.time() - start_time
 
             st.success(f"Update transaction prepared on Node {primary_node} in {duration:.3f}s")
@@ -451,14 +692,22 @@ def render(get_node_for_account, log_transaction):
 
             # Show preview of change
             with st.expander("Pending Update"):
-                st.write("**Before:**")
-                st.dataframe(found_data)
-                st.write("**After (pending commit):**")
-                updated_preview = found_data.copy()
-                updated_preview['amount'] = new_amount
-                updated_preview['type'] = new_type
-                updated_preview['operation'] = new_operation
-                st.dataframe(updated_preview)
+                # found_data is a single row, so build the "after" frame from its record
+                # instead of copying the whole frame and overwriting columns
+                updated_preview = pd.DataFrame([{
+                    **found_data.to_dict('records')[0],
+                    'amount': new_amount,
+                    'type': new_type,
+                    'operation': new_operation
+                }], columns=found_data.columns)
+                
+                before_col, after_col = st.columns(2)
+                with before_col:
+                    st.write("**Before:**")
+                    st.dataframe(found_data, use_container_width=True, hide_index=True)
+                with after_col:
+                    st.write("**After (pending commit):**")
+                    st.dataframe(updated_preview, use_container_width=True, hide_index=True)
                 
                 if primary_node == 1:
                     st.caption(f"Update prepared on Node 1 (central) - will replicate to Node {partition_node} on commit")
@@ -472,4 +721,6 @@ def render(get_node_for_account, log_transaction):
             st.error(f"Error: {str(e)}")
             # On error, release lock immediately since transaction won't proceed
             if lock_acquired:
-                st.session_state.lock_manager.release_multi_node_lock(resource_id, nodes=[1, 2, 3])
\ No newline at end of file
+                _release_lock(st.session_state.lock_manager, resource_id)
+        finally:
+            _end_action("update", update_token)
\ No newline at end of file
@@ -1,6 +1,179 @@
 import streamlit as st
 import pandas as pd
-from python.db.db_config import fetch_data
+from concurrent.futures import ThreadPoolExecutor
+from python.db.db_config import fetch_data, _query_cache
+
+# Seconds the aggregate report queries are reused across reruns
+REPORT_CACHE_TTL = 60
+
+# Amounts stay numeric in the frames and are formatted client-side by the dataframe widget
+CURRENCY_COLUMN = st.column_config.NumberColumn(format="dollar")
+
+TYPE_QUERY = """
+SELECT 
+    type,
+    COUNT(*) as count,
+    SUM(amount) as total_amount,
+    AVG(amount) as avg_amount
+FROM trans
+GROUP BY type
+"""
+
+# Amount range labels in bucket order; the last range takes every row the others don't match
+AMOUNT_RANGE_LABELS = [
+    'Under $1,000',
+    '$1,000 - $5,000',
+    '$5,000 - $10,000',
+    '$10,000 - $50,000',
+    'Over $50,000'
+]
+
+# Bucket counts and min/max in a single pass, without a GROUP BY temporary table
+DISTRIBUTION_QUERY = """
+SELECT 
+    MIN(amount) as min_amount,
+    MAX(amount) as max_amount,
+    COUNT(*) as total_count,
+    SUM(CASE WHEN amount < 1000 THEN 1 ELSE 0 END) as bucket_0,
+    SUM(CASE WHEN amount >= 1000 AND amount < 5000 THEN 1 ELSE 0 END) as bucket_1,
+    SUM(CASE WHEN amount >= 5000 AND amount < 10000 THEN 1 ELSE 0 END) as bucket_2,
+    SUM(CASE WHEN amount >= 10000 AND amount < 50000 THEN 1 ELSE 0 END) as bucket_3
+FROM trans
+"""
+
+YEAR_QUERY = """
+SELECT 
+    YEAR(newdate) as year,
+    COUNT(*) as transaction_count,
+    SUM(amount) as total_amount
+FROM trans
+GROUP BY YEAR(newdate)
+ORDER BY year DESC
+LIMIT 10
+"""
+
+
+# Report queries run together on Node 1, keyed by report name
+REPORT_QUERIES = {
+    'type': TYPE_QUERY,
+    'distribution': DISTRIBUTION_QUERY,
+    'year': YEAR_QUERY
+}
+
+
+def _shape_distribution(distribution_data):
+    """
+    Turn the single-row distribution query result into the amount range table.
+
+    Args:
+        distribution_data: Result of DISTRIBUTION_QUERY
+
+    Returns:
+        tuple: (ranges DataFrame with amount_range/count, min_amount, max_amount)
+    """
+    row = distribution_data.iloc[0]
+
+    counts = [int(row[f'bucket_{i}'] or 0) for i in range(len(AMOUNT_RANGE_LABELS) - 1)]
+    # Last range is everything not counted above (including NULL amounts)
+    counts.append(int(row['total_count']) - sum(counts))
+
+    # Only non-empty ranges, in ascending order, like a GROUP BY over the buckets
+    ranges_data = pd.DataFrame({
+        'amount_range': AMOUNT_RANGE_LABELS,
+        'count': counts
+    })
+    ranges_data = ranges_data[ranges_data['count'] > 0].reset_index(drop=True)
+
+    return ranges_data, row['min_amount'], row['max_amount']
+
+
+# Each aggregate is a full-table scan on Node 1, so results are memoized across reruns.
+# ttl=0 on fetch_data keeps a cache miss going to the database for fresh data.
+@st.cache_data(ttl=REPORT_CACHE_TTL, show_spinner=False)
+def _report_data():
+    """
+    Run the report queries concurrently on Node 1 (wall time = slowest query, not the sum).
+
+    Returns:
+        dict: 'type' and 'year' DataFrames, and 'distribution' as returned by _shape_distribution
+    """
+    with ThreadPoolExecutor(max_workers=len(REPORT_QUERIES)) as executor:
+        futures = {
+            name: executor.submit(fetch_data, query, 1, 0)
+            for name, query in REPORT_QUERIES.items()
+        }
+        results = {name: future.result() for name, future in futures.items()}
+
+    results['distribution'] = _shape_distribution(results['distribution'])
+    return results
+
+
+# ============================================================================
+# TRANSACTION TYPE BREAKDOWN
+# ============================================================================
+@st.fragment
+def _type_section(type_data):
+    """Render the transaction type breakdown"""
+    st.header("Transaction Type Breakdown")
+
+    if not type_data.empty:
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.subheader("Transaction Counts")
+            st.dataframe(type_data[['type', 'count']], use_container_width=True, hide_index=True)
+        
+        with col2:
+            st.subheader("Amount Statistics")
+            st.dataframe(
+                type_data,
+                column_order=['type', 'total_amount', 'avg_amount'],
+                column_config={'total_amount': CURRENCY_COLUMN, 'avg_amount': CURRENCY_COLUMN},
+                use_container_width=True,
+                hide_index=True
+            )
+
+
+# ============================================================================
+# AMOUNT DISTRIBUTION
+# ============================================================================
+@st.fragment
+def _distribution_section(distribution):
+    """Render the amount ranges and min/max amounts"""
+    st.header("Amount Distribution")
+    
+    ranges_data, min_amount, max_amount = distribution
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("Amount Ranges")
+        if not ranges_data.empty:
+            st.dataframe(ranges_data, use_container_width=True, hide_index=True)
+    
+    with col2:
+        st.subheader("Min/Max Amounts")
+        if pd.notna(min_amount) and pd.notna(max_amount):
+            st.metric("Minimum Amount", f"${min_amount:,.2f}")
+            st.metric("Maximum Amount", f"${max_amount:,.2f}")
+
+
+# ============================================================================
+# YEARLY SUMMARY
+# ============================================================================
+@st.fragment
+def _yearly_section(year_data):
+    """Render the transactions by year summary"""
+    st.header("Transactions by Year")
+
+    if not year_data.empty:
+        st.dataframe(
+            year_data,
+            column_config={'total_amount': CURRENCY_COLUMN},
+            use_container_width=True,
+            hide_index=True
+        )
+
 
 def render():
     """Render the View Reports page with aggregated summaries"""
@@ -18,116 +191,25 @@ def render():
     with col2:
         refresh_button = st.button("🔄 Refresh Data", use_container_width=True, help="Get latest data from database")
 
-    # Clear cache and force fresh data if refresh button is clicked
+    # Drop the cached report queries and force fresh data if refresh button is clicked
     if refresh_button:
-        from python.db.db_config import _query_cache
         _query_cache.clear()
-        try:
-            st.cache_data.clear()
-            st.cache_resource.clear()
-        except:
-            pass
+        _report_data.clear()
         st.rerun()
 
     try:
-        # ============================================================================
-        # TRANSACTION TYPE BREAKDOWN
-        # ============================================================================
-        st.header("Transaction Type Breakdown")
+        reports = _report_data()
         
-        type_query = """
-        SELECT 
-            type,
-            COUNT(*) as count,
-            SUM(amount) as total_amount,
-            AVG(amount) as avg_amount
-        FROM trans
-        GROUP BY type
-        """
-        # Force fresh data by setting ttl=0
-        type_data = fetch_data(type_query, node=1, ttl=0)
-
-        if not type_data.empty:
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.subheader("Transaction Counts")
-                st.dataframe(type_data[['type', 'count']], use_container_width=True, hide_index=True)
-            
-            with col2:
-                st.subheader("Amount Statistics")
-                type_data_formatted = type_data.copy()
-                type_data_formatted['total_amount'] = type_data_formatted['total_amount'].apply(lambda x: f"${x:,.2f}")
-                type_data_formatted['avg_amount'] = type_data_formatted['avg_amount'].apply(lambda x: f"${x:,.2f}")
-                st.dataframe(type_data_formatted[['type', 'total_amount', 'avg_amount']], use_container_width=True, hide_index=True)
+        _type_section(reports['type'])
         
         st.markdown("---")
         
-        # ============================================================================
-        # AMOUNT DISTRIBUTION
-        # ============================================================================
-        st.header("Amount Distribution")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.subheader("Amount Ranges")
-            ranges_query = """
-            SELECT 
-                CASE 
-                    WHEN amount < 1000 THEN 'Under $1,000'
-                    WHEN amount >= 1000 AND amount < 5000 THEN '$1,000 - $5,000'
-                    WHEN amount >= 5000 AND amount < 10000 THEN '$5,000 - $10,000'
-                    WHEN amount >= 10000 AND amount < 50000 THEN '$10,000 - $50,000'
-                    ELSE 'Over $50,000'
-                END as amount_range,
-                COUNT(*) as count
-            FROM trans
-            GROUP BY amount_range
-            ORDER BY MIN(amount)
-            """
-            ranges_data = fetch_data(ranges_query, node=1, ttl=0)
-            if not ranges_data.empty:
-                st.dataframe(ranges_data, use_container_width=True, hide_index=True)
-        
-        with col2:
-            st.subheader("Min/Max Amounts")
-            minmax_query = """
-            SELECT 
-                MIN(amount) as min_amount,
-                MAX(amount) as max_amount
-            FROM trans
-            """
-            minmax_data = fetch_data(minmax_query, node=1, ttl=0)
-            if not minmax_data.empty:
-                st.metric("Minimum Amount", f"${minmax_data['min_amount'][0]:,.2f}")
-                st.metric("Maximum Amount", f"${minmax_data['max_amount'][0]:,.2f}")
+        _distribution_section(reports['distribution'])
         
         st.markdown("---")
         
-        # ============================================================================
-        # YEARLY SUMMARY
-        # ============================================================================
-        st.header("Transactions by Year")
-        
-        year_query = """
-        SELECT 
-            YEAR(newdate) as year,
-            COUNT(*) as transaction_count,
-            SUM(amount) as total_amount
-        FROM trans
-        GROUP BY YEAR(newdate)
-        ORDER BY year DESC
-        LIMIT 10
-        """
-        year_data = fetch_data(year_query, node=1, ttl=0)
-
-        if not year_data.empty:
-            year_data_formatted = year_data.copy()
-            year_data_formatted['total_amount'] = year_data_formatted['total_amount'].apply(lambda x: f"${x:,.2f}")
-            st.dataframe(year_data_formatted, use_container_width=True, hide_index=True)
-        
+        _yearly_section(reports['year'])
         
     except Exception as e:
         st.error(f"Error loading reports: {str(e)}")
-        st.info("Make sure the database is running and accessible.")
\ No newline at end of file
+        st.info("Make sure the database is running and accessible.")
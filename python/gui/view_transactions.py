@@ -5,7 +5,9 @@ Supports viewing transactions even when one node is offline by combining data fr
 import streamlit as st
 import pandas as pd
 import time
+import math
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 import sys
 import os
 
@@ -13,7 +15,92 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
 
 from python.utils.server_ping import NodePinger
-from python.db.db_config import fetch_data
+from python.db.db_config import fetch_data, _query_cache
+from python.gui._styles import load_button_css
+from python.utils.recovery_manager import execute_global_recovery
+
+# Selectable trans columns (names are whitelisted here, so they can be formatted into SQL)
+TRANS_COLUMNS = ["trans_id", "account_id", "newdate", "type", "operation", "amount", "k_symbol"]
+DEFAULT_COLUMNS = ["trans_id", "account_id", "newdate", "type", "operation", "amount"]
+
+# Canonical Arrow-backed schema for fetched trans rows, so frames from different
+# nodes (or an empty result) concatenate and sort without falling back to object
+TRANS_DTYPES = {
+    "trans_id": "int64[pyarrow]",
+    "account_id": "int64[pyarrow]",
+    "newdate": "date32[pyarrow]",
+    "type": "string[pyarrow]",
+    "operation": "string[pyarrow]",
+    "amount": "double[pyarrow]",
+    "k_symbol": "string[pyarrow]"
+}
+
+# Seconds a node ping result is reused across reruns
+NODE_STATUS_TTL = 2
+
+# Rows sent to the browser per page of results
+PAGE_SIZE = 100
+
+
+# Global recovery runs here, off the Fetch path; one worker keeps runs from overlapping
+_RECOVERY_EXECUTOR = ThreadPoolExecutor(max_workers=1)
+
+
+@st.cache_data(ttl=NODE_STATUS_TTL, show_spinner=False)
+def _cached_node_status(nodes=(1, 2, 3)):
+    """Ping the given nodes, reusing the result for reruns within NODE_STATUS_TTL seconds"""
+    if tuple(nodes) == (1, 2, 3):
+        return NodePinger().ping_all_nodes()
+    return NodePinger().ping_nodes(nodes)
+
+
+def _run_recovery():
+    """Execute global recovery; cached query results are dropped if any logs were replayed"""
+    recovery_result = execute_global_recovery()
+    # Recovered logs changed node data, so cached query results are stale
+    if recovery_result.get('recovered', 0) > 0:
+        _query_cache.clear()
+    return recovery_result
+
+
+def _show_recovery_result(recovery_result):
+    """Report the outcome of a finished background recovery run"""
+    if recovery_result.get('lock_acquired', False):
+        if recovery_result['total_logs'] > 0:
+            if recovery_result['recovered'] > 0:
+                st.success(f"Processed {recovery_result['recovered']} recovery logs successfully")
+            if recovery_result['failed'] > 0:
+                st.warning(f"{recovery_result['failed']} recovery logs failed - check system logs")
+            elif recovery_result['recovered'] == 0:
+                st.info("No recovery logs needed processing")
+        else:
+            st.info("No new recovery logs to process")
+    else:
+        st.info("Recovery already running by another process")
+
+
+@st.fragment
+def _result_table(signature):
+    """
+    Show the last fetched result one page at a time. The result is kept in session
+    state, so paging reruns only this fragment and never re-queries the nodes.
+
+    Args:
+        signature: (query, params) of the current filters; a result fetched with
+                   other filters isn't shown
+    """
+    result = st.session_state.get('view_result')
+    if not result or result['signature'] != signature:
+        return
+
+    data = result['data']
+    page = 1
+    page_count = math.ceil(len(data) / PAGE_SIZE)
+    if page_count > 1:
+        page = st.number_input("Page", min_value=1, max_value=page_count, value=1, key="view_page")
+        st.caption(f"Rows {(page - 1) * PAGE_SIZE + 1}-{min(page * PAGE_SIZE, len(data))} of {len(data)}")
+
+    st.dataframe(data.iloc[(page - 1) * PAGE_SIZE:page * PAGE_SIZE], use_container_width=True)
 
 
 def render(get_node_for_account, log_transaction):
@@ -33,7 +120,7 @@ def render(get_node_for_account, log_transaction):
     col1, col2, col3 = st.columns(3)
 
     with col1:
-        account_id = st.text_input("Account ID", placeholder="Leave empty for all")
+        account_id_text = st.text_input("Account ID", placeholder="Leave empty for all")
 
     with col2:
         trans_type = st.selectbox("Transaction Type",
@@ -46,57 +133,57 @@ def render(get_node_for_account, log_transaction):
             help="Select a single date or date range. Leave empty for all dates."
         )
 
-    # Check node status (backend only)
-    pinger = NodePinger()
-    node_status = pinger.ping_all_nodes()
+    selected_columns = st.multiselect(
+        "Columns",
+        TRANS_COLUMNS,
+        default=DEFAULT_COLUMNS,
+        help="Only the selected columns are fetched. trans_id is always included."
+    )
+
+    # trans_id is needed to de-duplicate and sort combined node results
+    columns = [col for col in TRANS_COLUMNS if col == "trans_id" or col in selected_columns]
 
-    # Build query based on filters
-    base_query = "SELECT * FROM trans WHERE 1=1"
+    # Build query based on filters (values are bound by the driver, never formatted into SQL)
+    clauses = ["1=1"]
+    query_params = []
     
-    if account_id:
-        base_query += f" AND account_id = {account_id}"
+    # Parse the account filter once; the typed value is used for routing and binding
+    account_id = None
+    if account_id_text.strip():
+        if not account_id_text.strip().isdigit():
+            st.error("Account ID must be a whole number")
+            return
+        account_id = int(account_id_text)
+        clauses.append("account_id = %s")
+        query_params.append(account_id)
         
     if trans_type != "All":
-        base_query += f" AND type = '{trans_type}'"
+        clauses.append("type = %s")
+        query_params.append(trans_type)
     
     # Handle date range filter
     if date_range:
         if isinstance(date_range, (list, tuple)) and len(date_range) == 2:
             # Date range with start and end dates
             start_date, end_date = date_range
-            base_query += f" AND DATE(trans_time) BETWEEN '{start_date}' AND '{end_date}'"
+            clauses.append("DATE(trans_time) BETWEEN %s AND %s")
+            query_params.extend([start_date, end_date])
         elif len(date_range) == 1:
             # Single date selected
             selected_date = date_range[0]
-            base_query += f" AND DATE(trans_time) = '{selected_date}'"
+            clauses.append("DATE(trans_time) = %s")
+            query_params.append(selected_date)
 
-    # Don't add LIMIT to individual queries - we'll limit the combined result
-    query_without_limit = base_query
-    base_query += f" LIMIT {limit}"
+    # Every node returns at most `limit` rows in trans_id order (the PK index serves the
+    # ORDER BY); the combined result is merged and limited again after de-duplication
+    base_query = (
+        f"SELECT {', '.join(columns)} FROM trans WHERE {' AND '.join(clauses)} "
+        f"ORDER BY trans_id LIMIT %s"
+    )
+    query_params = tuple(query_params) + (int(limit),)
 
     # Execute button with custom styling
-    st.markdown("""
-    <style>
-    div.stButton > button {
-        background-color: #4B5C4B;
-        color: white;
-        border-color: #4B5C4B;
-    }
-    div.stButton > button:hover {
-        background-color: #3A4A3A;
-        border-color: #3A4A3A;
-    }
-    /* Rollback button styling */
-    button[data-testid="baseButton-secondary"]:has(p:contains("Rollback")) {
-        background-color: #692727 !important;
-        border-color: #692727 !important;
-    }
-    button[data-testid="baseButton-secondary"]:has(p:contains("Rollback")):hover {
-        background-color: #531F1F !important;
-        border-color: #531F1F !important;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    st.html(load_button_css())
 
     btn_col1, btn_col2, btn_col3 = st.columns(3)
     with btn_col1:
@@ -117,38 +204,28 @@ def render(get_node_for_account, log_transaction):
     if fetch_button:
         start_time = time.time()
         
-        # Execute global recovery with checkpoints before fetching data
-        with st.spinner("Processing pending recovery logs..."):
+        # Check node status (backend only); an account read only needs its
+        # partition node and Node 1 (central) as the fallback
+        if account_id is not None:
+            node_status = _cached_node_status(tuple(sorted({get_node_for_account(account_id), 1})))
+        else:
+            node_status = _cached_node_status()
+        
+        # Execute global recovery in the background so the fetch doesn't wait on it;
+        # the outcome of the previous run is reported once it has finished
+        recovery_future = st.session_state.get('view_recovery_future')
+        if recovery_future is not None and recovery_future.done():
             try:
-                from python.utils.recovery_manager import execute_global_recovery
-                recovery_result = execute_global_recovery()
-                
-                if recovery_result.get('lock_acquired', False):
-                    if recovery_result['total_logs'] > 0:
-                        if recovery_result['recovered'] > 0:
-                            st.success(f"Processed {recovery_result['recovered']} recovery logs successfully")
-                        if recovery_result['failed'] > 0:
-                            st.warning(f"{recovery_result['failed']} recovery logs failed - check system logs")
-                        elif recovery_result['recovered'] == 0:
-                            st.info("No recovery logs needed processing")
-                    else:
-                        st.info("No new recovery logs to process")
-                else:
-                    st.info("Recovery already running by another process")
-                    
+                _show_recovery_result(recovery_future.result())
             except Exception as recovery_error:
                 st.warning(f"Recovery processing encountered an issue: {str(recovery_error)}")
                 print(f"[VIEW_TRANSACTIONS] Recovery processing failed: {str(recovery_error)}")
                 # Continue with fetch even if recovery fails
+            recovery_future = None
+        
+        if recovery_future is None:
+            st.session_state.view_recovery_future = _RECOVERY_EXECUTOR.submit(_run_recovery)
         
-        # Clear all caches to force fresh data retrieval
-        from python.db.db_config import _query_cache
-        _query_cache.clear()
-        try:
-            st.cache_data.clear()
-            st.cache_resource.clear()
-        except:
-            pass
 
         # Determine strategy based on node availability
         online_nodes = [node for node, status in node_status.items() if status]
@@ -160,11 +237,12 @@ def render(get_node_for_account, log_transaction):
             
         # Log node status to backend only
         print(f"[VIEW_TRANSACTIONS] Online nodes: {online_nodes}, Offline nodes: {offline_nodes}")
+        print(f"[VIEW_TRANSACTIONS] Query: {base_query} | Params: {query_params}")
         
         # Show applied filters (simplified)
-        if account_id or trans_type != "All" or date_range:
+        if account_id is not None or trans_type != "All" or date_range:
             filters_applied = []
-            if account_id:
+            if account_id is not None:
                 filters_applied.append(f"Account ID: {account_id}")
             if trans_type != "All":
                 filters_applied.append(f"Type: {trans_type}")
@@ -176,20 +254,24 @@ def render(get_node_for_account, log_transaction):
             st.info(f"Applied filters: {', '.join(filters_applied)}")
         
         try:
-            combined_data = pd.DataFrame()
+            # Non-empty frames from each queried node (Arrow-backed, so the merge,
+            # de-duplication and display work on columnar buffers), concatenated once
+            # after the fetches; an empty list means no rows were found
+            frames = []
             query_sources = []
             
             with st.spinner("Fetching data from available nodes..."):
                 
-                if account_id:
+                if account_id is not None:
                     # Specific account query - determine target node
-                    target_node = get_node_for_account(int(account_id))
+                    target_node = get_node_for_account(account_id)
                     
                     if target_node in online_nodes:
                         # Target node is online - query directly
                         print(f"[VIEW_TRANSACTIONS] Querying Node {target_node} (target partition for account {account_id})")
-                        data = fetch_data(base_query, node=target_node, ttl=0)
-                        combined_data = pd.concat([combined_data, data], ignore_index=True)
+                        data = fetch_data(base_query, node=target_node, ttl=0, params=query_params, dtypes=TRANS_DTYPES)
+                        if len(data):
+                            frames.append(data)
                         query_sources.append(f"Node {target_node} (partition)")
                     else:
                         # Target node is offline - check Node 1 (central) if available
@@ -197,8 +279,9 @@ def render(get_node_for_account, log_transaction):
                         
                         if 1 in online_nodes and target_node != 1:
                             print(f"[VIEW_TRANSACTIONS] Searching Node 1 (central) as fallback...")
-                            data = fetch_data(base_query, node=1, ttl=0)
-                            combined_data = pd.concat([combined_data, data], ignore_index=True)
+                            data = fetch_data(base_query, node=1, ttl=0, params=query_params, dtypes=TRANS_DTYPES)
+                            if len(data):
+                                frames.append(data)
                             query_sources.append("Node 1 (central fallback)")
                         else:
                             st.error(f"Cannot retrieve data for account {account_id}. Please try again later.")
@@ -209,41 +292,58 @@ def render(get_node_for_account, log_transaction):
                     if 1 in online_nodes:
                         # Node 1 is online - it has complete data
                         print("[VIEW_TRANSACTIONS] Node 1 online - querying complete central database")
-                        data = fetch_data(query_without_limit, node=1, ttl=0)
-                        combined_data = pd.concat([combined_data, data], ignore_index=True)
+                        data = fetch_data(base_query, node=1, ttl=0, params=query_params, dtypes=TRANS_DTYPES)
+                        if len(data):
+                            frames.append(data)
                         query_sources.append("Node 1 (complete)")
                         
                     else:
                         # Node 1 is offline - combine Node 2 and Node 3
                         print("[VIEW_TRANSACTIONS] Node 1 offline - combining partition nodes for complete view")
                         
-                        for node in [2, 3]:
-                            if node in online_nodes:
-                                print(f"[VIEW_TRANSACTIONS] Querying Node {node} partition data...")
-                                data = fetch_data(query_without_limit, node=node, ttl=0)
-                                combined_data = pd.concat([combined_data, data], ignore_index=True)
-                                query_sources.append(f"Node {node} (partition)")
+                        # Query both partitions at once; results are combined in node order
+                        partition_nodes = [node for node in [2, 3] if node in online_nodes]
+                        if partition_nodes:
+                            with ThreadPoolExecutor(max_workers=len(partition_nodes)) as executor:
+                                futures = {
+                                    node: executor.submit(fetch_data, base_query, node, 0, query_params, dtypes=TRANS_DTYPES)
+                                    for node in partition_nodes
+                                }
+                                # Only the partition path can return a trans_id twice, so
+                                # duplicates are filtered here as each node's rows come in
+                                seen_ids = set()
+                                for node in partition_nodes:
+                                    print(f"[VIEW_TRANSACTIONS] Querying Node {node} partition data...")
+                                    data = futures[node].result()
+                                    if seen_ids and len(data):
+                                        duplicates = data['trans_id'].isin(seen_ids)
+                                        if duplicates.any():
+                                            print(f"[VIEW_TRANSACTIONS] Removed {int(duplicates.sum())} duplicate records")
+                                            data = data[~duplicates]
+                                    if len(data):
+                                        seen_ids.update(data['trans_id'].tolist())
+                                        frames.append(data)
+                                    query_sources.append(f"Node {node} (partition)")
                         
-                        if combined_data.empty:
+                        if not frames:
                             st.error("Cannot retrieve complete data at this time. Please try again later.")
                             print("[VIEW_TRANSACTIONS] No partition nodes available - cannot retrieve complete data")
                 
-                # Remove duplicates and apply limit
-                if not combined_data.empty:
-                    # Remove duplicates based on trans_id (primary key)
-                    initial_count = len(combined_data)
-                    combined_data = combined_data.drop_duplicates(subset=['trans_id'], keep='first')
-                    final_count = len(combined_data)
-                    
-                    if initial_count != final_count:
-                        print(f"[VIEW_TRANSACTIONS] Removed {initial_count - final_count} duplicate records")
-                    
-                    # Sort by trans_id and apply limit
-                    combined_data = combined_data.sort_values('trans_id').head(limit)
+                got_rows = bool(frames)
+                combined_data = (
+                    pd.concat(frames, axis=0, ignore_index=True, sort=False, copy=False)
+                    if got_rows else pd.DataFrame()
+                )
+                
+                # Apply limit
+                if got_rows:
+                    # Merge the per-node sorted runs by trans_id and apply limit
+                    combined_data = combined_data.sort_values('trans_id', kind='mergesort').head(limit)
                     
             duration = time.time() - start_time
             
-            if combined_data.empty:
+            if not got_rows:
+                st.session_state.pop('view_result', None)
                 st.warning("No data found matching your criteria")
             else:
                 st.success(f"Retrieved {len(combined_data)} rows in {duration:.3f}s")
@@ -251,7 +351,12 @@ def render(get_node_for_account, log_transaction):
                 # Log data source information to backend
                 print(f"[VIEW_TRANSACTIONS] Data sources: {', '.join(query_sources)}")
                 
-                st.dataframe(combined_data, use_container_width=True)
+                # Keep the result for the paged table below, starting again at page 1
+                st.session_state.view_result = {
+                    'signature': (base_query, query_params),
+                    'data': combined_data
+                }
+                st.session_state.pop('view_page', None)
                 
                 # Log strategy details to backend only
                 print(f"[VIEW_TRANSACTIONS] Query Strategy: {'Single node' if len(query_sources) == 1 else 'Multi-node combination'}")
@@ -270,4 +375,6 @@ def render(get_node_for_account, log_transaction):
                 
         except Exception as e:
             st.error(f"Error retrieving data: {str(e)}")
-            st.error("Please check node connectivity and try again")
\ No newline at end of file
+            st.error("Please check node connectivity and try again")
+
+    _result_table((base_query, query_params))
\ No newline at end of file
@@ -20,6 +20,8 @@ to ensure consistency in concurrent transactions. Works locally and on Google Cl
 
 import warnings
 import mysql.connector
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from mysql.connector import pooling
 from typing import Dict, Any, Optional, List
 from python.utils.lock_manager import DistributedLockManager
 import time
@@ -109,12 +111,19 @@ class DatabaseManager:
                 }
             }
         
+        # Connection pools per node, created on first use
+        self._pools: Dict[int, pooling.MySQLConnectionPool] = {}
+        
+        # Last connectivity check per node: (monotonic time, is_up)
+        self._last_ping: Dict[int, tuple] = {}
+        
         # Initialize distributed lock manager
         self.lock_manager = DistributedLockManager(self.node_configs, current_node_id)
     
     def get_connection(self, node: int) -> mysql.connector.connection.MySQLConnection:
         """
-        Get a connection to a specific node.
+        Get a pooled connection to a specific node.
+        close() returns it to the node's pool.
         
         Args:
             node: Node number (1, 2, or 3)
@@ -126,14 +135,24 @@ class DatabaseManager:
             raise ValueError(f"Invalid node number: {node}")
         
         try:
-            return mysql.connector.connect(**self.node_configs[node])
+            pool = self._pools.get(node)
+            if pool is None:
+                pool = pooling.MySQLConnectionPool(
+                    pool_name=f"db_manager_node{node}",
+                    pool_size=8,
+                    # Callers set their own isolation level on every checkout
+                    pool_reset_session=False,
+                    **self.node_configs[node]
+                )
+                self._pools[node] = pool
+            return pool.get_connection()
         except Exception as e:
             config = self.node_configs[node]
             raise Exception(f"Failed to connect to Node {node} ({config['host']}:{config['port']}): {e}")
     
     def create_dedicated_connection(self, node: int, isolation_level: str = "REPEATABLE READ") -> mysql.connector.connection.MySQLConnection:
         """
-        Create a dedicated connection with specific isolation level.
+        Get a pooled connection with specific isolation level.
         Use this for concurrent transaction testing.
         
         Args:
@@ -188,7 +207,6 @@ class DatabaseManager:
             conn = self.create_dedicated_connection(target_node, isolation_level)
             cursor = conn.cursor()
             
-            cursor.execute("START TRANSACTION")
             cursor.execute(query, params)
             affected_rows = cursor.rowcount
             conn.commit()
@@ -248,8 +266,7 @@ class DatabaseManager:
                     'results': {}
                 }
             
-            # Execute on all nodes
-            for node in nodes:
+            def _exec_one(node):
                 conn = None
                 cursor = None
                 
@@ -257,12 +274,11 @@ class DatabaseManager:
                     conn = self.create_dedicated_connection(node, isolation_level)
                     cursor = conn.cursor()
                     
-                    cursor.execute("START TRANSACTION")
                     cursor.execute(query, params)
                     affected_rows = cursor.rowcount
                     conn.commit()
                     
-                    results[node] = {
+                    return {
                         'status': 'success',
                         'affected_rows': affected_rows
                     }
@@ -271,16 +287,9 @@ class DatabaseManager:
                     if conn:
                         conn.rollback()
                     
-                    results[node] = {
-                        'status': 'failed',
-                        'error': str(e)
-                    }
-                    
-                    # If any node fails, mark overall status as failed
                     return {
                         'status': 'failed',
-                        'error': f'Failed on Node {node}: {e}',
-                        'results': results
+                        'error': str(e)
                     }
                 
                 finally:
@@ -289,6 +298,21 @@ class DatabaseManager:
                     if conn:
                         conn.close()
             
+            # Execute on all nodes in parallel; the writes are independent once the locks are held
+            with ThreadPoolExecutor(max_workers=len(nodes)) as executor:
+                futures = {executor.submit(_exec_one, node): node for node in nodes}
+                for future in as_completed(futures):
+                    results[futures[future]] = future.result()
+            
+            # If any node fails, mark overall status as failed
+            for node in nodes:
+                if results[node]['status'] == 'failed':
+                    return {
+                        'status': 'failed',
+                        'error': f"Failed on Node {node}: {results[node]['error']}",
+                        'results': results
+                    }
+            
             return {
                 'status': 'success',
                 'message': f'Query executed successfully on nodes {nodes}',
@@ -351,19 +375,28 @@ class DatabaseManager:
             dict mapping node numbers to connectivity status
         """
         status = {}
+        now = time.monotonic()
         
         for node in self.node_configs.keys():
+            # Reuse a check from the last second instead of probing again
+            last = self._last_ping.get(node)
+            if last is not None and now - last[0] < 1.0:
+                status[node] = last[1]
+                continue
+            
             try:
+                # COM_PING on a pooled connection instead of a SELECT 1 round trip
                 conn = self.get_connection(node)
-                cursor = conn.cursor()
-                cursor.execute("SELECT 1")
-                cursor.fetchone()
-                cursor.close()
-                conn.close()
+                try:
+                    conn.ping(reconnect=False, attempts=1, delay=0)
+                finally:
+                    conn.close()
                 status[node] = True
             except Exception as e:
                 print(f"Node {node} connectivity check failed: {e}")
                 status[node] = False
+            
+            self._last_ping[node] = (time.monotonic(), status[node])
         
         return status
     
@@ -1,9 +1,33 @@
 import mysql.connector
 import time
 import threading
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import datetime
 from typing import Optional, Dict, Any
 
+# Number of stripes the in-process lock table is split into (power of two, see _partition_for)
+LOCK_PARTITIONS = 16
+
+# Outcomes of a single-node lock attempt (see _acquire_lock)
+_LOCK_ACQUIRED = "acquired"        # we inserted the lock row
+_LOCK_REENTERED = "reentered"      # the row was already held under our locked_by
+_LOCK_HELD = "held"                # another owner kept it until the timeout
+_LOCK_UNREACHABLE = "unreachable"  # could not connect to the node
+_LOCK_ERROR = "error"              # the node answered but the attempt failed
+_LOCK_GRANTED = (_LOCK_ACQUIRED, _LOCK_REENTERED)
+
+
+class _LockPartition:
+    """One stripe of the in-process lock table, guarded by its own mutex"""
+
+    __slots__ = ("mutex", "locks", "pending_releases")
+
+    def __init__(self):
+        self.mutex = threading.Lock()
+        self.locks: Dict[str, Dict[int, Optional[str]]] = {}  # {resource_id: {node: lock_token}}
+        self.pending_releases: Dict[str, Future] = {}  # {resource_id: background release}
+
 
 class DistributedLockManager:
     """
@@ -25,7 +49,11 @@ class DistributedLockManager:
         self.node_configs = node_configs
         self.current_node_id = current_node_id
         self.available = True
-        self._active_locks = {}  # Track locks we currently hold: {resource_id: [node_list]}
+        # Track locks we currently hold, striped by resource so that concurrent lock
+        # calls on different resources never wait on the same mutex
+        self._partitions = [_LockPartition() for _ in range(LOCK_PARTITIONS)]
+        # Workers for releases the caller doesn't wait on (see release_multi_node_lock_async)
+        self._release_executor = ThreadPoolExecutor(max_workers=4)
         
         # Periodic cleanup thread (always enabled)
         self._cleanup_running = True
@@ -33,6 +61,44 @@ class DistributedLockManager:
         self._cleanup_thread.start()
         print(f"[{self.current_node_id}] Periodic cleanup thread started (5-minute interval)")
     
+    def _partition_for(self, resource_id: str) -> _LockPartition:
+        """Get the lock table partition that tracks a resource"""
+        return self._partitions[hash(resource_id) & (LOCK_PARTITIONS - 1)]
+    
+    def _track_lock(self, resource_id: str, node: int, token: Optional[str]):
+        """Record that we hold the lock on a resource at a node, under the row's lock token"""
+        partition = self._partition_for(resource_id)
+        with partition.mutex:
+            partition.locks.setdefault(resource_id, {})[node] = token
+    
+    def _untrack_lock(self, resource_id: str, node: int, token: Optional[str] = None):
+        """Forget the lock on a resource at a node (only if it is still tracked under token, when given)"""
+        partition = self._partition_for(resource_id)
+        with partition.mutex:
+            tokens = partition.locks.get(resource_id)
+            if tokens and node in tokens and (token is None or tokens[node] == token):
+                del tokens[node]
+                if not tokens:
+                    del partition.locks[resource_id]
+    
+    def _tracked_token(self, resource_id: str, node: int) -> Optional[str]:
+        """Get the lock token we hold a resource under at a node, if any"""
+        partition = self._partition_for(resource_id)
+        with partition.mutex:
+            return partition.locks.get(resource_id, {}).get(node)
+    
+    def _set_tracked_nodes(self, resource_id: str, tokens: Dict[int, Optional[str]]):
+        """Replace the tracked {node: lock_token} map of a resource"""
+        partition = self._partition_for(resource_id)
+        with partition.mutex:
+            partition.locks[resource_id] = dict(tokens)
+    
+    def _pop_tracked_nodes(self, resource_id: str) -> Dict[int, Optional[str]]:
+        """Stop tracking a resource, returning the {node: lock_token} map it was locked under"""
+        partition = self._partition_for(resource_id)
+        with partition.mutex:
+            return partition.locks.pop(resource_id, {})
+    
     def _get_connection(self, node: int) -> mysql.connector.connection.MySQLConnection:
         """
         Get a connection to a specific node.
@@ -70,19 +136,40 @@ class DistributedLockManager:
         Returns:
             bool: True if lock acquired successfully, False otherwise
         """
+        status, token = self._acquire_lock(resource_id, node, timeout, str(uuid.uuid4()))
+        if status not in _LOCK_GRANTED:
+            return False
+        
+        self._track_lock(resource_id, node, token)
+        return True
+    
+    def _acquire_lock(self, resource_id: str, node: int, timeout: int, token: str) -> tuple:
+        """
+        Try to take the lock on a resource at one node, without tracking it.
+        
+        Args:
+            resource_id: Unique identifier for the resource
+            node: Node number where the lock should be acquired
+            timeout: Maximum seconds to wait for lock acquisition
+            token: Lock token to write if we insert the lock row
+            
+        Returns:
+            tuple: (status, lock_token) - status is one of the _LOCK_* outcomes; lock_token is
+                   the token on the row we now hold (None if not granted)
+        """
         lock_name = f"lock_{resource_id}"
         start_time = time.time()
         
         select_lock_sql = """
-        SELECT locked_by, lock_time 
+        SELECT locked_by, lock_time, lock_token 
         FROM distributed_lock 
         WHERE lock_name = %s
         FOR UPDATE  -- Row-level lock to prevent race conditions
         """
         
         insert_lock_sql = """
-        INSERT INTO distributed_lock (lock_name, locked_by) 
-        VALUES (%s, %s)
+        INSERT INTO distributed_lock (lock_name, locked_by, lock_token) 
+        VALUES (%s, %s, %s)
         """
         
         update_lock_sql = """
@@ -101,6 +188,11 @@ class DistributedLockManager:
         
         try:
             conn = self._get_connection(node)
+        except Exception as e:
+            print(f"[{self.current_node_id}] Failed to connect to Node {node} for lock acquisition: {e}")
+            return _LOCK_UNREACHABLE, None
+        
+        try:
             cursor = conn.cursor(dictionary=True)
             
             # Loop until we acquire the lock or timeout
@@ -109,7 +201,7 @@ class DistributedLockManager:
                 
                 if elapsed > timeout:
                     print(f"[{self.current_node_id}] Lock acquisition timeout for {resource_id} on Node {node}")
-                    return False
+                    return _LOCK_HELD, None
                 
                 try:
                     # Start transaction for atomic lock check-and-acquire
@@ -122,16 +214,11 @@ class DistributedLockManager:
                     if result is None:
                         # Lock doesn't exist - create it atomically
                         try:
-                            cursor.execute(insert_lock_sql, (lock_name, self.current_node_id))
+                            cursor.execute(insert_lock_sql, (lock_name, self.current_node_id, token))
                             conn.commit()
                             
-                            # Track this lock
-                            if resource_id not in self._active_locks:
-                                self._active_locks[resource_id] = []
-                            self._active_locks[resource_id].append(node)
-                            
                             print(f"[{self.current_node_id}] ✓ Acquired lock on {resource_id} at Node {node}")
-                            return True
+                            return _LOCK_ACQUIRED, token
                             
                         except mysql.connector.IntegrityError:
                             # Should not happen with FOR UPDATE, but handle gracefully
@@ -140,18 +227,16 @@ class DistributedLockManager:
                             continue
                     
                     else:
-                        # Lock exists - check if it's ours
-                        if result['locked_by'] == self.current_node_id:
+                        # Lock exists - check if it's ours. Every session of the app shares
+                        # locked_by, so the row's token must also be one this manager holds
+                        # (rows from before lock tokens only match on locked_by)
+                        if result['locked_by'] == self.current_node_id and (
+                            result['lock_token'] is None
+                            or result['lock_token'] == self._tracked_token(resource_id, node)
+                        ):
                             conn.commit()  # Release the row lock
                             print(f"[{self.current_node_id}] ✓ Already hold lock on {resource_id} at Node {node}")
-                            
-                            # Track this lock if not already tracked
-                            if resource_id not in self._active_locks:
-                                self._active_locks[resource_id] = []
-                            if node not in self._active_locks[resource_id]:
-                                self._active_locks[resource_id].append(node)
-                            
-                            return True
+                            return _LOCK_REENTERED, result['lock_token']
                         
                         # Lock is held by another transaction
                         lock_age = (datetime.now() - result['lock_time']).total_seconds()
@@ -173,11 +258,11 @@ class DistributedLockManager:
                 except Exception as e:
                     print(f"[{self.current_node_id}] Error acquiring lock on Node {node}: {e}")
                     conn.rollback()
-                    return False
+                    return _LOCK_ERROR, None
         
         except Exception as e:
-            print(f"[{self.current_node_id}] Failed to connect to Node {node} for lock acquisition: {e}")
-            return False
+            print(f"[{self.current_node_id}] Error acquiring lock on Node {node}: {e}")
+            return _LOCK_ERROR, None
         
         finally:
             if cursor:
@@ -185,23 +270,39 @@ class DistributedLockManager:
             if conn:
                 conn.close()
     
-    def release_lock(self, resource_id: str, node: int) -> bool:
+    def release_lock(self, resource_id: str, node: int, token: Optional[str] = None) -> bool:
         """
         Release a lock on a specific resource at a specific node.
         
+        Only the row written by our own acquisition is deleted (matched by its lock token),
+        so a late release can't remove a newer lock taken under the same locked_by.
+        
         Args:
             resource_id: Unique identifier for the resource
             node: Node number where the lock should be released
+            token: Lock token to release (default: the token we track for this node)
             
         Returns:
             bool: True if lock released successfully, False otherwise
         """
         lock_name = f"lock_{resource_id}"
         
-        delete_lock_sql = """
-        DELETE FROM distributed_lock 
-        WHERE lock_name = %s AND locked_by = %s
-        """
+        if token is None:
+            token = self._tracked_token(resource_id, node)
+        
+        if token is None:
+            # Untracked or pre-token lock row: fall back to matching on the owner
+            delete_lock_sql = """
+            DELETE FROM distributed_lock 
+            WHERE lock_name = %s AND locked_by = %s
+            """
+            params = (lock_name, self.current_node_id)
+        else:
+            delete_lock_sql = """
+            DELETE FROM distributed_lock 
+            WHERE lock_name = %s AND locked_by = %s AND lock_token = %s
+            """
+            params = (lock_name, self.current_node_id, token)
         
         conn = None
         cursor = None
@@ -210,14 +311,11 @@ class DistributedLockManager:
             conn = self._get_connection(node)
             cursor = conn.cursor()
             
-            cursor.execute(delete_lock_sql, (lock_name, self.current_node_id))
+            cursor.execute(delete_lock_sql, params)
             conn.commit()
             
             # Remove from tracking
-            if resource_id in self._active_locks and node in self._active_locks[resource_id]:
-                self._active_locks[resource_id].remove(node)
-                if not self._active_locks[resource_id]:
-                    del self._active_locks[resource_id]
+            self._untrack_lock(resource_id, node, token)
             
             print(f"[{self.current_node_id}] ✓ Released lock on {resource_id} at Node {node}")
             return True
@@ -281,8 +379,11 @@ class DistributedLockManager:
         Acquire locks on the same resource across multiple available nodes.
         
         This implements the GROWING PHASE of 2-Phase Locking (2PL) with FAULT TOLERANCE.
-        Locks are acquired on any available nodes, even if some nodes are down.
-        This ensures high availability - operations succeed as long as at least 1 node is up.
+        Locks are requested on all nodes concurrently under one lock token, and the call
+        returns as soon as a majority of the nodes grant the lock. Otherwise it waits for
+        every node and needs a majority of the nodes it could reach, so operations still
+        succeed while nodes are down, but two owners can never both hold a quorum. Locks
+        granted to a failed attempt or after quorum are released in the background.
         
         Args:
             resource_id: Unique identifier for the resource
@@ -290,51 +391,107 @@ class DistributedLockManager:
             timeout: Maximum seconds to wait for lock acquisitions
             
         Returns:
-            bool: True if locks acquired on at least 1 node, False if all nodes failed
+            bool: True if locks acquired on a quorum of the reachable nodes, False otherwise
         """
-        start_time = time.time()
-        acquired_nodes = []
+        if not nodes:
+            return False
+        
+        # A release of our previous lock on this resource may still be running; let it
+        # finish first so it can't untrack or delete the lock we're about to take
+        self._wait_for_pending_release(resource_id)
+        
+        quorum = len(nodes) // 2 + 1
+        token = str(uuid.uuid4())
+        acquired_nodes = {}  # {node: lock_token}
         failed_nodes = []
+        unreachable_nodes = []
+        acquired = False
         
-        print(f"[{self.current_node_id}] 📈 2PL GROWING PHASE: Acquiring locks on {resource_id} across nodes {nodes}")
+        print(f"[{self.current_node_id}] 📈 2PL GROWING PHASE: Acquiring locks on {resource_id} across nodes {nodes} (quorum {quorum})")
         
-        # FAULT TOLERANT: Try each node, continue even if some fail
-        for node in nodes:
-            remaining_timeout = timeout - (time.time() - start_time)
-            
-            if remaining_timeout <= 0:
-                print(f"[{self.current_node_id}] ⏱️ Lock acquisition timeout reached")
-                break
-            
-            try:
-                if self.acquire_lock(resource_id, node, int(remaining_timeout)):
-                    acquired_nodes.append(node)
+        # FAULT TOLERANT: Try every node at once, continue even if some fail
+        executor = ThreadPoolExecutor(max_workers=len(nodes))
+        futures = {
+            executor.submit(self._acquire_lock, resource_id, node, timeout, token): node
+            for node in nodes
+        }
+        
+        try:
+            for future in as_completed(futures):
+                node = futures[future]
+                try:
+                    status, node_token = future.result()
+                except Exception as e:
+                    status, node_token = _LOCK_ERROR, None
+                    print(f"[{self.current_node_id}]   ⚠️ Node {node} error: {str(e)[:100]}")
+                
+                if status in _LOCK_GRANTED:
+                    acquired_nodes[node] = node_token
                     print(f"[{self.current_node_id}]   ✓ Lock acquired on Node {node}")
+                elif status == _LOCK_UNREACHABLE:
+                    unreachable_nodes.append(node)
+                    print(f"[{self.current_node_id}]   ⚠️ Node {node} unavailable")
                 else:
                     failed_nodes.append(node)
                     print(f"[{self.current_node_id}]   ⚠️ Could not acquire lock on Node {node} (may be held)")
-            except Exception as e:
-                failed_nodes.append(node)
-                print(f"[{self.current_node_id}]   ⚠️ Node {node} unavailable: {str(e)[:100]}")
-        
-        # HIGH AVAILABILITY: Succeed if ANY nodes acquired locks
-        if acquired_nodes:
-            # Track which specific nodes have locks
-            self._active_locks[resource_id] = acquired_nodes
-            
-            if failed_nodes:
-                print(f"[{self.current_node_id}] ✅ 2PL GROWING PHASE COMPLETE: Locks acquired on {len(acquired_nodes)}/{len(nodes)} nodes {acquired_nodes}")
-                print(f"[{self.current_node_id}]    ℹ️ Nodes unavailable: {failed_nodes} (high availability mode)")
-            else:
-                print(f"[{self.current_node_id}] ✅ 2PL GROWING PHASE COMPLETE: All locks acquired on {resource_id}")
-            
-            # ACTIVE SYNC: Sync existing locks to recovered nodes
-            self._sync_locks_to_recovered_nodes(resource_id, acquired_nodes, failed_nodes)
+                
+                if len(acquired_nodes) >= quorum:
+                    break
             
-            return True
-        else:
-            print(f"[{self.current_node_id}] ❌ 2PL GROWING PHASE FAILED: No nodes available for {resource_id}")
+            # HIGH AVAILABILITY: Without a majority of all nodes, settle for a majority of the
+            # nodes that answered. A node that failed because the lock is held still counts.
+            reachable = len(nodes) - len(unreachable_nodes)
+            acquired = bool(acquired_nodes) and len(acquired_nodes) >= reachable // 2 + 1
+        finally:
+            # Don't wait on stragglers; give back any lock we took that isn't part of the result
+            # (stragglers that finish after quorum, or everything if the attempt failed)
+            for future, node in futures.items():
+                if node not in acquired_nodes or not acquired:
+                    future.add_done_callback(
+                        lambda f, node=node: self._release_straggler_lock(f, resource_id, node)
+                    )
+            executor.shutdown(wait=False)
+        
+        if not acquired:
+            print(f"[{self.current_node_id}] ❌ 2PL GROWING PHASE FAILED: Locks on {resource_id} acquired on {len(acquired_nodes)}/{reachable} reachable nodes, no quorum")
             return False
+        
+        # Track which specific nodes have locks
+        self._set_tracked_nodes(resource_id, acquired_nodes)
+        
+        if len(acquired_nodes) < len(nodes):
+            print(f"[{self.current_node_id}] ✅ 2PL GROWING PHASE COMPLETE: Locks acquired on {len(acquired_nodes)}/{len(nodes)} nodes {list(acquired_nodes)}")
+            if unreachable_nodes:
+                print(f"[{self.current_node_id}]    ℹ️ Nodes unavailable: {unreachable_nodes} (high availability mode)")
+        else:
+            print(f"[{self.current_node_id}] ✅ 2PL GROWING PHASE COMPLETE: All locks acquired on {resource_id}")
+        
+        # ACTIVE SYNC: Sync existing locks to recovered nodes
+        self._sync_locks_to_recovered_nodes(resource_id, list(acquired_nodes), unreachable_nodes)
+        
+        return True
+    
+    def _release_straggler_lock(self, future, resource_id: str, node: int):
+        """
+        Release a lock a multi-node attempt took but is not keeping.
+        
+        Only a row the attempt inserted itself is deleted, and only while it still carries
+        the attempt's lock token. A row we merely re-entered belongs to whoever inserted it.
+        
+        Args:
+            future: Completed _acquire_lock future for the node
+            resource_id: The resource that was being locked
+            node: Node the lock was requested on
+        """
+        try:
+            status, token = future.result()
+        except Exception:
+            # Straggler failed to acquire, nothing to release
+            return
+        
+        if status == _LOCK_ACQUIRED:
+            print(f"[{self.current_node_id}]   ↩️ Releasing unused lock on {resource_id} at Node {node}")
+            self.release_lock(resource_id, node, token)
     
     def release_multi_node_lock(self, resource_id: str, nodes: list) -> bool:
         """
@@ -352,19 +509,22 @@ class DistributedLockManager:
         Returns:
             bool: True if at least one lock released successfully
         """
-        # Get list of nodes where we actually acquired locks
-        acquired_nodes = self._active_locks.get(resource_id, [])
+        # Get the nodes where we actually acquired locks (and stop tracking them)
+        acquired_nodes = self._pop_tracked_nodes(resource_id)
+        tokens = set(acquired_nodes.values())
         
         print(f"[{self.current_node_id}] 📉 2PL SHRINKING PHASE: Releasing locks on {resource_id}")
-        print(f"[{self.current_node_id}]    Locks were on: {acquired_nodes}, attempting release on all: {nodes}")
+        print(f"[{self.current_node_id}]    Locks were on: {list(acquired_nodes)}, attempting release on all: {nodes}")
         
         released_count = 0
         failed_nodes = []
         
-        # FAULT TOLERANT: Try to release on ALL nodes (self-healing)
+        # FAULT TOLERANT: Try to release on ALL nodes (self-healing), but only rows carrying
+        # one of our lock tokens
         for node in nodes:
+            node_tokens = [acquired_nodes[node]] if node in acquired_nodes else tokens
             try:
-                if self.release_lock(resource_id, node):
+                if any([self.release_lock(resource_id, node, token) for token in node_tokens]):
                     released_count += 1
                     print(f"[{self.current_node_id}]   ✓ Lock released on Node {node}")
                 else:
@@ -374,10 +534,6 @@ class DistributedLockManager:
                 failed_nodes.append(node)
                 print(f"[{self.current_node_id}]   ⚠️ Could not reach Node {node}: {str(e)[:50]}")
         
-        # Remove from active locks tracking
-        if resource_id in self._active_locks:
-            del self._active_locks[resource_id]
-        
         if released_count > 0:
             print(f"[{self.current_node_id}] ✅ 2PL SHRINKING PHASE COMPLETE: Released locks on {released_count}/{len(nodes)} nodes")
             return True
@@ -385,6 +541,50 @@ class DistributedLockManager:
             print(f"[{self.current_node_id}] ⚠️ 2PL SHRINKING PHASE: No locks could be released")
             return False
     
+    def release_multi_node_lock_async(self, resource_id: str, nodes: list) -> Future:
+        """
+        Run release_multi_node_lock on a background worker.
+        
+        The release stays registered until it finishes, and acquire_multi_node_lock on
+        the same resource waits for it, so a slow release never runs over a newer lock.
+        
+        Args:
+            resource_id: Unique identifier for the resource
+            nodes: List of all node numbers where locks should be released
+            
+        Returns:
+            Future: Resolves to the result of release_multi_node_lock
+        """
+        partition = self._partition_for(resource_id)
+        with partition.mutex:
+            future = self._release_executor.submit(self.release_multi_node_lock, resource_id, nodes)
+            partition.pending_releases[resource_id] = future
+        
+        future.add_done_callback(lambda f: self._clear_pending_release(resource_id, f))
+        return future
+    
+    def _clear_pending_release(self, resource_id: str, future: Future):
+        """Forget a finished background release, unless a newer one replaced it"""
+        partition = self._partition_for(resource_id)
+        with partition.mutex:
+            if partition.pending_releases.get(resource_id) is future:
+                del partition.pending_releases[resource_id]
+    
+    def _wait_for_pending_release(self, resource_id: str):
+        """Block until any background release of a resource has finished"""
+        partition = self._partition_for(resource_id)
+        with partition.mutex:
+            future = partition.pending_releases.get(resource_id)
+        
+        if future is None:
+            return
+        
+        print(f"[{self.current_node_id}] Waiting for pending release of {resource_id}")
+        try:
+            future.result()
+        except Exception as e:
+            print(f"[{self.current_node_id}] Pending release of {resource_id} failed: {e}")
+    
     def _sync_locks_to_recovered_nodes(self, resource_id: str, healthy_nodes: list, failed_nodes: list):
         """
         Actively sync existing locks to nodes that have recovered.
@@ -396,7 +596,7 @@ class DistributedLockManager:
         Args:
             resource_id: The resource being locked
             healthy_nodes: Nodes where locks were successfully acquired
-            failed_nodes: Nodes that failed during lock acquisition
+            failed_nodes: Nodes that were unreachable during lock acquisition
         """
         if not failed_nodes or not healthy_nodes:
             return  # Nothing to sync
@@ -410,7 +610,7 @@ class DistributedLockManager:
             source_conn = self._get_connection(source_node)
             source_cursor = source_conn.cursor(dictionary=True)
             source_cursor.execute(
-                "SELECT locked_by, lock_time FROM distributed_lock WHERE lock_name = %s",
+                "SELECT locked_by, lock_time, lock_token FROM distributed_lock WHERE lock_name = %s",
                 (lock_name,)
             )
             lock_record = source_cursor.fetchone()
@@ -428,10 +628,11 @@ class DistributedLockManager:
                     
                     # Insert or replace lock on recovered node
                     target_cursor.execute("""
-                        INSERT INTO distributed_lock (lock_name, locked_by, lock_time)
-                        VALUES (%s, %s, %s)
-                        ON DUPLICATE KEY UPDATE locked_by = VALUES(locked_by), lock_time = VALUES(lock_time)
-                    """, (lock_name, lock_record['locked_by'], lock_record['lock_time']))
+                        INSERT INTO distributed_lock (lock_name, locked_by, lock_time, lock_token)
+                        VALUES (%s, %s, %s, %s)
+                        ON DUPLICATE KEY UPDATE locked_by = VALUES(locked_by), lock_time = VALUES(lock_time),
+                                                lock_token = VALUES(lock_token)
+                    """, (lock_name, lock_record['locked_by'], lock_record['lock_time'], lock_record['lock_token']))
                     
                     target_conn.commit()
                     target_cursor.close()
@@ -440,8 +641,7 @@ class DistributedLockManager:
                     print(f"[{self.current_node_id}]   🔄 Synced lock to recovered Node {target_node}")
                     
                     # Update tracking to include this node
-                    if resource_id in self._active_locks and target_node not in self._active_locks[resource_id]:
-                        self._active_locks[resource_id].append(target_node)
+                    self._track_lock(resource_id, target_node, lock_record['lock_token'])
                     
                 except Exception as e:
                     # Node still down or sync failed, ignore
@@ -532,7 +732,9 @@ class DistributedLockManager:
                     conn.close()
         
         # Clear tracking
-        self._active_locks = {}
+        for partition in self._partitions:
+            with partition.mutex:
+                partition.locks.clear()
         
         if total_released > 0:
             print(f"[{self.current_node_id}] ✓ Released {total_released} total locks across all nodes")
@@ -544,7 +746,11 @@ class DistributedLockManager:
         Returns:
             dict: Mapping of resource_id to list of nodes where locks are held
         """
-        return self._active_locks.copy()
+        active_locks = {}
+        for partition in self._partitions:
+            with partition.mutex:
+                active_locks.update((resource_id, list(nodes)) for resource_id, nodes in partition.locks.items())
+        return active_locks
     
     def is_available(self) -> bool:
         """
@@ -631,6 +837,9 @@ class DistributedLockManager:
         if self._cleanup_thread.is_alive():
             self._cleanup_thread.join(timeout=2)
         
+        # Let background releases finish before the blanket release below
+        self._release_executor.shutdown(wait=True)
+        
         self.release_all_locks()
 
 
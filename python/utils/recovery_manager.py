@@ -4,14 +4,120 @@ Handles the 4 case studies for distributed database recovery
 """
 
 import hashlib
+import logging
 import os
+import queue
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Iterator, Tuple
 import mysql.connector
 from mysql.connector import Error
 
 
+# Per-log progress during recovery sweeps goes to DEBUG (off unless logging is configured
+# for it); summaries and failures are still printed
+logger = logging.getLogger(__name__)
+
+# Log a failed replication, keyed on the unique transaction_hash. A hash that is
+# already PENDING or COMPLETED is left untouched; a FAILED one is reopened so it
+# gets retried, and LAST_INSERT_ID(log_id) makes lastrowid report its log_id.
+UPSERT_RECOVERY_LOG_SQL = """
+    INSERT INTO recovery_log 
+    (target_node, source_node, sql_statement, transaction_hash, error_message)
+    VALUES (%s, %s, %s, %s, %s)
+    ON DUPLICATE KEY UPDATE
+        log_id = LAST_INSERT_ID(log_id),
+        retry_count = IF(status = 'FAILED', 0, retry_count),
+        error_message = IF(status = 'FAILED', VALUES(error_message), error_message),
+        status = IF(status = 'FAILED', 'PENDING', status)
+"""
+
+
+def _release_connection(connection):
+    """
+    Return a pooled connection to its pool. Pooled sessions are not reset on
+    check-in, so end any transaction still open on it first.
+    """
+    try:
+        connection.rollback()
+    except Error:
+        pass
+    connection.close()
+
+
+# Recovery logs read per query when sweeping a node's logs past its checkpoint
+RECOVERY_LOG_PAGE_SIZE = 500
+
+# Cross-backup rows are written by one background thread, in batches of up to
+# CROSS_BACKUP_BATCH_SIZE rows or whatever arrived within CROSS_BACKUP_FLUSH_INTERVAL seconds
+CROSS_BACKUP_BATCH_SIZE = 100
+CROSS_BACKUP_FLUSH_INTERVAL = 0.05
+
+_cross_backup_queue: "queue.Queue[Tuple[int, tuple]]" = queue.Queue(maxsize=10000)
+_cross_backup_thread: Optional[threading.Thread] = None
+_cross_backup_thread_lock = threading.Lock()
+
+
+def _queue_cross_backup(backup_node: int, row: tuple):
+    """Hand a cross-backup row to the writer thread, starting it on first use"""
+    global _cross_backup_thread
+    with _cross_backup_thread_lock:
+        if _cross_backup_thread is None or not _cross_backup_thread.is_alive():
+            _cross_backup_thread = threading.Thread(target=_drain_cross_backups, daemon=True)
+            _cross_backup_thread.start()
+    
+    try:
+        _cross_backup_queue.put_nowait((backup_node, row))
+    except queue.Full:
+        print(f"Cross-backup queue full - dropped backup for Node {backup_node}")
+
+
+def _drain_cross_backups():
+    """Collect queued cross-backup rows into batches and write each batch per backup node"""
+    while True:
+        batch = [_cross_backup_queue.get()]
+        deadline = time.monotonic() + CROSS_BACKUP_FLUSH_INTERVAL
+        while len(batch) < CROSS_BACKUP_BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(_cross_backup_queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        
+        rows_by_node: Dict[int, List[tuple]] = {}
+        for backup_node, row in batch:
+            rows_by_node.setdefault(backup_node, []).append(row)
+        
+        for backup_node, rows in rows_by_node.items():
+            _write_cross_backups(backup_node, rows)
+
+
+def _write_cross_backups(backup_node: int, rows: List[tuple]):
+    """Insert a batch of cross-backup rows into a backup node's recovery_log"""
+    from python.db.pool import get_pooled_connection
+    
+    connection = None
+    cursor = None
+    try:
+        connection = get_pooled_connection(backup_node)
+        cursor = connection.cursor()
+        cursor.executemany(UPSERT_RECOVERY_LOG_SQL, rows)
+        connection.commit()
+        print(f"Cross-backup of {len(rows)} log(s) stored in Node {backup_node}")
+        
+    except Exception as e:
+        print(f"Failed to store {len(rows)} cross-backup(s) in Node {backup_node}: {e}")
+    finally:
+        if cursor:
+            cursor.close()
+        if connection:
+            _release_connection(connection)
+
+
 class RecoveryManager:
     """Manages recovery logs and operations for distributed database system"""
     
@@ -31,15 +137,23 @@ class RecoveryManager:
     def generate_transaction_hash(self, target_node: int, source_node: int, sql_statement: str) -> str:
         """Generate unique hash to prevent duplicate recovery logs"""
         unique_string = f"{target_node}_{source_node}_{sql_statement}_{datetime.now().strftime('%Y%m%d')}"
-        return hashlib.sha256(unique_string.encode()).hexdigest()
+        # Only a dedup key, so a fast 128-bit non-cryptographic digest is enough
+        return hashlib.blake2b(unique_string.encode(), digest_size=16, usedforsecurity=False).hexdigest()
     
     def get_db_connection(self):
-        """Get database connection for current node"""
+        """Get pooled database connection for current node"""
+        return self.get_node_connection(self.current_node_id)
+    
+    def get_node_connection(self, node_id: int):
+        """
+        Check out a connection to a node from its connection pool.
+        close() hands the connection back to the pool instead of disconnecting.
+        """
+        from python.db.pool import get_pooled_connection
         try:
-            connection = mysql.connector.connect(**self.db_config)
-            return connection
-        except Error as e:
-            print(f"Error connecting to database: {e}")
+            return get_pooled_connection(node_id)
+        except Exception as e:
+            print(f"Error connecting to Node {node_id}: {e}")
             raise
     
     def log_backup(self, target_node: int, source_node: int, sql_statement: str) -> bool:
@@ -63,27 +177,15 @@ class RecoveryManager:
             connection = self.get_db_connection()
             cursor = connection.cursor()
             
-            # Check if this transaction is already logged
-            check_sql = """
-                SELECT COUNT(*) FROM recovery_log 
-                WHERE transaction_hash = %s AND status IN ('PENDING', 'COMPLETED')
-            """
-            cursor.execute(check_sql, (transaction_hash,))
+            # Insert recovery log; the unique transaction_hash key turns a repeat into a no-op
+            cursor.execute(UPSERT_RECOVERY_LOG_SQL, (target_node, source_node, sql_statement, transaction_hash, None))
+            connection.commit()
             
-            if cursor.fetchone()[0] > 0:
+            # rowcount: 1 = inserted, 2 = a FAILED log was reopened, 0 = already pending/completed
+            if cursor.rowcount == 0:
                 print(f"Transaction already logged (hash: {transaction_hash[:8]}...)")
                 return True
             
-            # Insert recovery log
-            insert_sql = """
-                INSERT INTO recovery_log 
-                (target_node, source_node, sql_statement, transaction_hash)
-                VALUES (%s, %s, %s, %s)
-            """
-            
-            cursor.execute(insert_sql, (target_node, source_node, sql_statement, transaction_hash))
-            connection.commit()
-            
             log_id = cursor.lastrowid
             print(f"Recovery log created: ID={log_id}, Target=Node{target_node}, Source=Node{source_node}")
             
@@ -99,10 +201,10 @@ class RecoveryManager:
             if cursor:
                 cursor.close()
             if connection:
-                connection.close()
+                _release_connection(connection)
     
     def _store_cross_backup(self, target_node: int, source_node: int, sql_statement: str, transaction_hash: str):
-        """Store backup log in another node to prevent single point of failure"""
+        """Store backup log in another node to prevent single point of failure (written in the background)"""
         try:
             # Determine backup node (avoid source and target nodes, and current node)
             backup_node = None
@@ -112,43 +214,14 @@ class RecoveryManager:
                     break
             
             if backup_node:
-                print(f"Storing cross-backup in Node {backup_node} (original in Node {self.current_node_id})")
-                
-                # Get configuration for the backup node
-                from python.db.db_config import get_node_config
-                backup_config = get_node_config(backup_node)
-                
-                connection = None
-                cursor = None
-                try:
-                    # Connect to the backup node
-                    import mysql.connector
-                    connection = mysql.connector.connect(**backup_config)
-                    cursor = connection.cursor()
-                    
-                    insert_sql = """
-                        INSERT INTO recovery_log 
-                        (target_node, source_node, sql_statement, transaction_hash, error_message)
-                        VALUES (%s, %s, %s, %s, %s)
-                    """
-                    
-                    cursor.execute(insert_sql, (
-                        target_node, 
-                        source_node, 
-                        sql_statement, 
-                        transaction_hash,
-                        f"CROSS_BACKUP_FROM_NODE_{self.current_node_id}"
-                    ))
-                    connection.commit()
-                    print(f"Cross-backup successfully stored in Node {backup_node}")
-                    
-                except Exception as e:
-                    print(f"Failed to store cross-backup in Node {backup_node}: {e}")
-                finally:
-                    if cursor:
-                        cursor.close()
-                    if connection:
-                        connection.close()
+                print(f"Queueing cross-backup for Node {backup_node} (original in Node {self.current_node_id})")
+                _queue_cross_backup(backup_node, (
+                    target_node, 
+                    source_node, 
+                    sql_statement, 
+                    transaction_hash,
+                    f"CROSS_BACKUP_FROM_NODE_{self.current_node_id}"
+                ))
             else:
                 print(f"No available backup node found (source={source_node}, target={target_node}, current={self.current_node_id})")
                 
@@ -180,14 +253,10 @@ class RecoveryManager:
             try:
                 print(f"Checking Node {check_node_id} for recovery logs targeting Node {self.current_node_id}...")
                 
-                # Get node configuration
-                from python.db.db_config import get_node_config
-                node_config = get_node_config(check_node_id)
-                
                 connection = None
                 cursor = None
                 try:
-                    connection = mysql.connector.connect(**node_config)
+                    connection = self.get_node_connection(check_node_id)
                     cursor = connection.cursor(dictionary=True)
                     
                     # Get pending recovery logs that target this node
@@ -221,7 +290,7 @@ class RecoveryManager:
                     if cursor:
                         cursor.close()
                     if connection:
-                        connection.close()
+                        _release_connection(connection)
                         
             except Exception as e:
                 print(f"Error checking Node {check_node_id}: {e}")
@@ -230,6 +299,9 @@ class RecoveryManager:
         # Sort all logs by timestamp to maintain chronological order
         all_pending_logs.sort(key=lambda x: x['timestamp'])
         
+        # Status updates are collected per (node, status, message) and written in bulk at the end
+        status_updates: Dict[Tuple[int, str, str], List[int]] = {}
+        
         # Deduplicate logs by transaction_hash to avoid processing the same transaction multiple times
         unique_logs = {}
         for log in all_pending_logs:
@@ -237,7 +309,9 @@ class RecoveryManager:
             if tx_hash and tx_hash in unique_logs:
                 print(f"Skipping duplicate log {log['log_id']} from Node {log['found_in_node']} (same hash as log {unique_logs[tx_hash]['log_id']} from Node {unique_logs[tx_hash]['found_in_node']})")
                 # Mark the duplicate as completed to prevent re-processing
-                self._mark_recovery_status_in_node(log['found_in_node'], log['log_id'], 'COMPLETED', "Duplicate transaction - skipped during deduplication")
+                status_updates.setdefault(
+                    (log['found_in_node'], 'COMPLETED', "Duplicate transaction - skipped during deduplication"), []
+                ).append(log['log_id'])
                 recovery_results['skipped'] += 1
             else:
                 unique_logs[tx_hash] = log
@@ -248,18 +322,25 @@ class RecoveryManager:
         
         if not deduplicated_logs:
             print(f"No unique pending recovery logs found for Node {self.current_node_id} after deduplication.")
+            self._apply_status_updates(status_updates)
             return recovery_results
         
         print(f"Found {len(all_pending_logs)} total logs, {len(deduplicated_logs)} unique after deduplication. Starting recovery...")
         
-        # Process unique recovery logs
-        for log in deduplicated_logs:
-            print(f"Processing unique log from Node {log['found_in_node']}: {log['sql_statement'][:50]}...")
-            result = self._attempt_recovery_cross_node(log)
-            recovery_results[result] += 1
-            
-            # Small delay between recovery attempts
-            time.sleep(0.1)
+        # Replay unique recovery logs over a single connection to this node
+        connection = None
+        try:
+            connection = self.get_db_connection()
+            for log in deduplicated_logs:
+                logger.debug("Processing unique log from Node %s: %.50s...", log['found_in_node'], log['sql_statement'])
+                result = self._attempt_recovery_cross_node(log, connection, status_updates)
+                recovery_results[result] += 1
+        except Exception as e:
+            print(f"Recovery interrupted for Node {self.current_node_id}: {e}")
+        finally:
+            if connection:
+                _release_connection(connection)
+            self._apply_status_updates(status_updates)
         
         print(f"Recovery completed: {recovery_results}")
         return recovery_results
@@ -292,7 +373,7 @@ class RecoveryManager:
             if target_node != self.current_node_id:
                 return 'skipped'
             
-            print(f"Attempting recovery for log {log_id}: {sql_statement[:50]}...")
+            logger.debug("Attempting recovery for log %s: %.50s...", log_id, sql_statement)
             
             # Execute the recovery transaction
             connection = self.get_db_connection()
@@ -305,7 +386,7 @@ class RecoveryManager:
             # Mark as completed
             self._mark_recovery_status(log_id, 'COMPLETED', "Recovery successful")
             
-            print(f"Successfully recovered log {log_id}")
+            logger.debug("Successfully recovered log %s", log_id)
             return 'recovered'
             
         except Error as e:
@@ -327,14 +408,18 @@ class RecoveryManager:
             if cursor:
                 cursor.close()
             if connection:
-                connection.close()
+                _release_connection(connection)
     
-    def _attempt_recovery_cross_node(self, log: Dict) -> str:
+    def _attempt_recovery_cross_node(self, log: Dict, connection=None,
+                                     status_updates: Optional[Dict[Tuple[int, str, str], List[int]]] = None) -> str:
         """
         Attempt to recover a single transaction log found in another node
         
         Args:
             log: Recovery log record with 'found_in_node' field
+            connection: Open connection to this node to reuse (a pooled one is checked out if None)
+            status_updates: Collects final log statuses for a later bulk update instead
+                            of marking each log in its source node right away
             
         Returns:
             str: Recovery result ('recovered', 'failed', 'skipped')
@@ -346,12 +431,12 @@ class RecoveryManager:
         retry_count = log['retry_count']
         transaction_hash = log.get('transaction_hash', '')
         
-        connection = None
+        owns_connection = connection is None
         cursor = None
         try:
             # Skip if max retries exceeded
             if retry_count >= self.max_retries:
-                self._mark_recovery_status_in_node(source_node, log_id, 'FAILED', f"Max retries ({self.max_retries}) exceeded")
+                self._set_log_status(status_updates, source_node, log_id, 'FAILED', f"Max retries ({self.max_retries}) exceeded")
                 return 'failed'
             
             # Skip if this is not the target node
@@ -359,7 +444,8 @@ class RecoveryManager:
                 return 'skipped'
             
             # Check if this transaction was already completed by checking transaction hash
-            connection = self.get_db_connection()
+            if owns_connection:
+                connection = self.get_db_connection()
             cursor = connection.cursor()
             
             # Check if we already have this transaction completed locally
@@ -371,29 +457,36 @@ class RecoveryManager:
                 cursor.execute(check_sql, (transaction_hash,))
                 
                 if cursor.fetchone()[0] > 0:
-                    print(f"Transaction hash {transaction_hash[:8]}... already completed - marking as skipped")
+                    logger.debug("Transaction hash %.8s... already completed - marking as skipped", transaction_hash)
                     # Mark the duplicate log as completed to avoid re-processing
-                    self._mark_recovery_status_in_node(source_node, log_id, 'COMPLETED', "Duplicate transaction - already processed")
+                    self._set_log_status(status_updates, source_node, log_id, 'COMPLETED', "Duplicate transaction - already processed")
                     return 'skipped'
             
-            print(f"Attempting cross-node recovery for log {log_id} from Node {source_node}: {sql_statement[:50]}...")
+            logger.debug("Attempting cross-node recovery for log %s from Node %s: %.50s...", log_id, source_node, sql_statement)
             
             # Execute the failed SQL statement
             cursor.execute(sql_statement)
             connection.commit()
             
             # Mark as completed in the source node where the log was found
-            self._mark_recovery_status_in_node(source_node, log_id, 'COMPLETED', "Cross-node recovery successful")
+            self._set_log_status(status_updates, source_node, log_id, 'COMPLETED', "Cross-node recovery successful")
             
-            print(f"Successfully recovered cross-node log {log_id} from Node {source_node}")
+            logger.debug("Successfully recovered cross-node log %s from Node %s", log_id, source_node)
             return 'recovered'
             
         except Error as e:
+            # Undo the failed statement so a shared connection can replay the next log
+            if connection and not owns_connection:
+                try:
+                    connection.rollback()
+                except Error:
+                    pass
+            
             # Check if this is a duplicate entry error (indicates transaction was already processed)
             if e.errno == 1062:  # MySQL duplicate entry error
                 print(f"Transaction already exists in database - marking as completed (hash: {transaction_hash[:8]}...)")
                 # Mark as completed since the data is already there
-                self._mark_recovery_status_in_node(source_node, log_id, 'COMPLETED', "Transaction already exists - duplicate detected")
+                self._set_log_status(status_updates, source_node, log_id, 'COMPLETED', "Transaction already exists - duplicate detected")
                 return 'skipped'
             
             error_msg = f"Cross-node recovery attempt {retry_count + 1} failed: {str(e)}"
@@ -406,8 +499,43 @@ class RecoveryManager:
         finally:
             if cursor:
                 cursor.close()
-            if connection:
-                connection.close()
+            if connection and owns_connection:
+                _release_connection(connection)
+    
+    def _set_log_status(self, status_updates: Optional[Dict[Tuple[int, str, str], List[int]]],
+                        node_id: int, log_id: int, status: str, error_message: str):
+        """Record a log's final status for a bulk update, or write it to its node immediately"""
+        if status_updates is None:
+            self._mark_recovery_status_in_node(node_id, log_id, status, error_message)
+        else:
+            status_updates.setdefault((node_id, status, error_message), []).append(log_id)
+    
+    def _apply_status_updates(self, status_updates: Dict[Tuple[int, str, str], List[int]]):
+        """Write collected log statuses with one UPDATE per node, status and message"""
+        for (node_id, status, error_message), log_ids in status_updates.items():
+            connection = None
+            cursor = None
+            try:
+                connection = self.get_node_connection(node_id)
+                cursor = connection.cursor()
+                
+                placeholders = ", ".join(["%s"] * len(log_ids))
+                update_sql = f"""
+                    UPDATE recovery_log 
+                    SET status = %s, error_message = %s
+                    WHERE log_id IN ({placeholders})
+                """
+                
+                cursor.execute(update_sql, (status, error_message, *log_ids))
+                connection.commit()
+                
+            except Exception as e:
+                print(f"Failed to update recovery status of logs {log_ids} in Node {node_id}: {e}")
+            finally:
+                if cursor:
+                    cursor.close()
+                if connection:
+                    _release_connection(connection)
     
     def _mark_recovery_status(self, log_id: int, status: str, error_message: str = None):
         """Mark recovery log with final status in current node"""
@@ -432,18 +560,14 @@ class RecoveryManager:
             if cursor:
                 cursor.close()
             if connection:
-                connection.close()
+                _release_connection(connection)
     
     def _mark_recovery_status_in_node(self, node_id: int, log_id: int, status: str, error_message: str = None):
         """Mark recovery log with final status in specified node"""
         connection = None
         cursor = None
         try:
-            # Get configuration for the specified node
-            from python.db.db_config import get_node_config
-            node_config = get_node_config(node_id)
-            
-            connection = mysql.connector.connect(**node_config)
+            connection = self.get_node_connection(node_id)
             cursor = connection.cursor()
             
             update_sql = """
@@ -461,7 +585,7 @@ class RecoveryManager:
             if cursor:
                 cursor.close()
             if connection:
-                connection.close()
+                _release_connection(connection)
     
     def _increment_retry_count(self, log_id: int, error_message: str):
         """Increment retry count for recovery log in current node"""
@@ -486,18 +610,14 @@ class RecoveryManager:
             if cursor:
                 cursor.close()
             if connection:
-                connection.close()
+                _release_connection(connection)
     
     def _increment_retry_count_in_node(self, node_id: int, log_id: int, error_message: str):
         """Increment retry count for recovery log in specified node"""
         connection = None
         cursor = None
         try:
-            # Get configuration for the specified node
-            from python.db.db_config import get_node_config
-            node_config = get_node_config(node_id)
-            
-            connection = mysql.connector.connect(**node_config)
+            connection = self.get_node_connection(node_id)
             cursor = connection.cursor()
             
             update_sql = """
@@ -515,7 +635,7 @@ class RecoveryManager:
             if cursor:
                 cursor.close()
             if connection:
-                connection.close()
+                _release_connection(connection)
     
     def get_recovery_status(self) -> Dict:
         """Get recovery logs status summary from current node"""
@@ -547,7 +667,7 @@ class RecoveryManager:
             if cursor:
                 cursor.close()
             if connection:
-                connection.close()
+                _release_connection(connection)
     
     def get_global_recovery_status(self) -> Dict:
         """Get global recovery status across all nodes"""
@@ -582,7 +702,7 @@ class RecoveryManager:
             if cursor:
                 cursor.close()
             if connection:
-                connection.close()
+                _release_connection(connection)
     def create_checkpoint_table_if_not_exists(self):
         """Create global checkpoint table if it doesn't exist"""
         connection = None
@@ -615,7 +735,7 @@ class RecoveryManager:
             if cursor:
                 cursor.close()
             if connection:
-                connection.close()
+                _release_connection(connection)
     
     def acquire_global_recovery_lock(self, timeout_seconds=30) -> bool:
         """Acquire global recovery lock to prevent concurrent recovery operations"""
@@ -649,7 +769,7 @@ class RecoveryManager:
             if cursor:
                 cursor.close()
             if connection:
-                connection.close()
+                _release_connection(connection)
     
     def release_global_recovery_lock(self):
         """Release global recovery lock"""
@@ -674,7 +794,7 @@ class RecoveryManager:
             if cursor:
                 cursor.close()
             if connection:
-                connection.close()
+                _release_connection(connection)
     
     def get_global_checkpoints(self) -> Dict[int, int]:
         """Get current global checkpoints for all nodes"""
@@ -709,7 +829,7 @@ class RecoveryManager:
             if cursor:
                 cursor.close()
             if connection:
-                connection.close()
+                _release_connection(connection)
     
     def update_checkpoint(self, node_id: int, last_processed_log_id: int):
         """Update checkpoint for a specific node"""
@@ -733,18 +853,16 @@ class RecoveryManager:
             if cursor:
                 cursor.close()
             if connection:
-                connection.close()
+                _release_connection(connection)
     
-    def get_new_recovery_logs_since_checkpoint(self, node_id: int, checkpoint: int) -> List[Dict]:
-        """Get recovery logs from a specific node since the last checkpoint"""
+    def get_new_recovery_logs_since_checkpoint(self, node_id: int, checkpoint: int,
+                                               limit: int = RECOVERY_LOG_PAGE_SIZE) -> List[Dict]:
+        """Get up to `limit` recovery logs from a specific node since the last checkpoint (or last page)"""
         connection = None
         cursor = None
         try:
             # Connect to the specific node to get its recovery logs
-            from python.db.db_config import get_node_config, get_db_connection
-            
-            node_config = get_node_config(node_id)
-            connection = get_db_connection(node_id)
+            connection = self.get_node_connection(node_id)
             cursor = connection.cursor(dictionary=True)
             
             # Get logs with log_id greater than checkpoint and status = 'PENDING'
@@ -754,7 +872,8 @@ class RecoveryManager:
                 FROM recovery_log 
                 WHERE log_id > %s AND status = 'PENDING'
                 ORDER BY log_id ASC
-            """, (checkpoint,))
+                LIMIT %s
+            """, (checkpoint, limit))
             
             logs = cursor.fetchall()
             
@@ -771,7 +890,7 @@ class RecoveryManager:
             if cursor:
                 cursor.close()
             if connection:
-                connection.close()
+                _release_connection(connection)
     
     def process_recovery_logs_with_global_checkpoints(self) -> Dict:
         """Process recovery logs using global checkpoints with concurrency control"""
@@ -803,42 +922,55 @@ class RecoveryManager:
             for node_id in [1, 2, 3]:
                 try:
                     current_checkpoint = checkpoints[node_id]
-                    new_logs = self.get_new_recovery_logs_since_checkpoint(node_id, current_checkpoint)
-                    
-                    if not new_logs:
-                        print(f"No new recovery logs for Node {node_id} since checkpoint {current_checkpoint}")
-                        continue
-                    
-                    print(f"Found {len(new_logs)} new recovery logs for Node {node_id}")
-                    recovery_results['nodes_processed'].append(node_id)
-                    recovery_results['total_logs'] += len(new_logs)
                     
                     # Process logs sequentially and track consecutive successes
                     last_consecutive_success = current_checkpoint
+                    processed_log_ids = []
                     
-                    for log in new_logs:
-                        try:
-                            result = self._attempt_recovery_cross_node(log)
-                            
-                            # Check for successful recovery (success, recovered, or skipped are all considered successful)
-                            if result in ['success', 'recovered', 'skipped']:
-                                recovery_results['recovered'] += 1
-                                print(f"Successfully processed log {log['log_id']} from Node {node_id} (status: {result})")
+                    # Page through the node's logs by log_id so only one page is held at a time
+                    after_log_id = current_checkpoint
+                    while True:
+                        new_logs = self.get_new_recovery_logs_since_checkpoint(node_id, after_log_id)
+                        if not new_logs:
+                            break
+                        
+                        print(f"Found {len(new_logs)} new recovery logs for Node {node_id}")
+                        if not processed_log_ids:
+                            recovery_results['nodes_processed'].append(node_id)
+                        recovery_results['total_logs'] += len(new_logs)
+                        
+                        for log in new_logs:
+                            try:
+                                result = self._attempt_recovery_cross_node(log)
                                 
-                                # Only update consecutive checkpoint if this log immediately follows the last processed
-                                if log['log_id'] == last_consecutive_success + 1:
-                                    last_consecutive_success = log['log_id']
-                                # If there's a gap, don't update consecutive checkpoint but continue processing
+                                # Check for successful recovery (success, recovered, or skipped are all considered successful)
+                                if result in ['success', 'recovered', 'skipped']:
+                                    recovery_results['recovered'] += 1
+                                    logger.debug("Successfully processed log %s from Node %s (status: %s)", log['log_id'], node_id, result)
+                                    
+                                    # Only update consecutive checkpoint if this log immediately follows the last processed
+                                    if log['log_id'] == last_consecutive_success + 1:
+                                        last_consecutive_success = log['log_id']
+                                    # If there's a gap, don't update consecutive checkpoint but continue processing
+                                        
+                                else:
+                                    recovery_results['failed'] += 1
+                                    print(f"Failed to recover log {log['log_id']} from Node {node_id}: {result}")
+                                    # Failed log breaks the consecutive chain - continue processing but don't update checkpoint
                                     
-                            else:
+                            except Exception as log_error:
                                 recovery_results['failed'] += 1
-                                print(f"Failed to recover log {log['log_id']} from Node {node_id}: {result}")
-                                # Failed log breaks the consecutive chain - continue processing but don't update checkpoint
-                                
-                        except Exception as log_error:
-                            recovery_results['failed'] += 1
-                            print(f"Exception processing log {log['log_id']}: {log_error}")
-                            # Exception breaks the consecutive chain
+                                print(f"Exception processing log {log['log_id']}: {log_error}")
+                                # Exception breaks the consecutive chain
+                        
+                        processed_log_ids.extend(log['log_id'] for log in new_logs)
+                        after_log_id = new_logs[-1]['log_id']
+                        if len(new_logs) < RECOVERY_LOG_PAGE_SIZE:
+                            break
+                    
+                    if not processed_log_ids:
+                        print(f"No new recovery logs for Node {node_id} since checkpoint {current_checkpoint}")
+                        continue
                     
                     # Update checkpoint only to the highest consecutive successful log_id
                     if last_consecutive_success > current_checkpoint:
@@ -848,7 +980,7 @@ class RecoveryManager:
                         
                         # Show information about any gaps
                         if recovery_results['failed'] > 0:
-                            remaining_logs = [log['log_id'] for log in new_logs if log['log_id'] > last_consecutive_success]
+                            remaining_logs = [log_id for log_id in processed_log_ids if log_id > last_consecutive_success]
                             if remaining_logs:
                                 print(f"Note: Logs {remaining_logs} will be retried in next recovery cycle due to earlier failures")
                     else:
@@ -873,13 +1005,10 @@ class RecoveryManager:
         # Check all nodes
         for node_id in [1, 2, 3]:
             try:
-                from python.db.db_config import get_node_config
-                node_config = get_node_config(node_id)
-                
                 connection = None
                 cursor = None
                 try:
-                    connection = mysql.connector.connect(**node_config)
+                    connection = self.get_node_connection(node_id)
                     cursor = connection.cursor()
                     
                     status_sql = """
@@ -904,7 +1033,7 @@ class RecoveryManager:
                     if cursor:
                         cursor.close()
                     if connection:
-                        connection.close()
+                        _release_connection(connection)
                         
             except Exception as e:
                 global_status['nodes'][f'node_{node_id}'] = {'error': f'Configuration error: {str(e)}'}
@@ -1015,20 +1144,22 @@ def replicate_transaction(query: str, source_node: int, target_node: int, isolat
     Returns:
         Dict: Replication result with status and message
     """
-    from python.db.db_config import get_node_config, create_dedicated_connection
+    from python.db.db_config import get_node_config
+    from python.db.pool import get_pooled_connection
     
+    conn = None
     try:
         print(f"Attempting replication: Node {source_node} -> Node {target_node}")
         
-        # Create connection to target node
-        conn = create_dedicated_connection(target_node, isolation_level)
+        # Check out a pooled connection to target node (isolation level already set)
+        conn = get_pooled_connection(target_node, isolation_level)
         cursor = conn.cursor()
         
-        # Execute the replication query
-        cursor.execute(query)
-        conn.commit()
+        # Start, apply and commit the replicated statement in a single round trip
+        statement = f"START TRANSACTION; {query.strip().rstrip(';')}; COMMIT"
+        for _ in cursor.execute(statement, multi=True):
+            pass
         cursor.close()
-        conn.close()
         
         print(f"Replication successful: Node {source_node} -> Node {target_node}")
         return {
@@ -1040,6 +1171,13 @@ def replicate_transaction(query: str, source_node: int, target_node: int, isolat
     except Exception as e:
         print(f"Replication failed: Node {source_node} -> Node {target_node}: {str(e)}")
         
+        # Don't hand a connection with a half-applied statement back to the pool
+        if conn is not None:
+            try:
+                conn.rollback()
+            except Exception:
+                pass
+        
         # Log the failure for recovery
         try:
             # Get source node config for recovery manager
@@ -1064,6 +1202,40 @@ def replicate_transaction(query: str, source_node: int, target_node: int, isolat
                 'logged': False,
                 'recovery_action': f'Recovery logging also failed: {str(log_error)}'
             }
+    
+    finally:
+        if conn is not None:
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+
+def replicate_transactions_batch(query: str, source_node: int, target_nodes: List[int],
+                                 isolation_level: str = "READ COMMITTED") -> Iterator[Tuple[int, Dict]]:
+    """
+    Replicate a transaction from source node to several target nodes at once
+    
+    Args:
+        query: SQL statement to replicate
+        source_node: Node that originated the transaction
+        target_nodes: Nodes to replicate to (duplicates are ignored)
+        isolation_level: Transaction isolation level
+        
+    Yields:
+        Tuple[int, Dict]: (target_node, replication result) as each target finishes
+    """
+    targets = list(dict.fromkeys(target_nodes))
+    if not targets:
+        return
+    
+    with ThreadPoolExecutor(max_workers=len(targets)) as executor:
+        futures = {
+            executor.submit(replicate_transaction, query, source_node, target_node, isolation_level): target_node
+            for target_node in targets
+        }
+        for future in as_completed(futures):
+            yield futures[future], future.result()
 
 
 # Example usage for the 4 case studies
@@ -4,6 +4,7 @@ Server Ping Utility - Check database node connectivity
 
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import sys
 import os
@@ -50,14 +51,28 @@ class NodePinger:
         except Exception:
             return False
 
+    def ping_nodes(self, nodes):
+        """
+        Check only the given nodes, all at once (an offline node costs a full connect timeout)
+
+        Args:
+            nodes: Node numbers to check
+
+        Returns:
+            dict: Status of the checked nodes {node_id: is_online}
+        """
+        nodes = list(nodes)
+        with ThreadPoolExecutor(max_workers=len(nodes)) as executor:
+            status = dict(zip(nodes, executor.map(self.check_node, nodes)))
+        self.node_status.update(status)
+        return status
+
     def ping_all_nodes(self):
         """Check all nodes and print status"""
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         previous_status = self.node_status.copy()
 
-        # Check each node
-        for node in [1, 2, 3]:
-            self.node_status[node] = self.check_node(node)
+        self.ping_nodes([1, 2, 3])
 
         # Detect nodes that came back online (no automatic recovery)
         recovered_nodes = []
@@ -0,0 +1,8 @@
+-- Brings an existing distributed_lock table up to the current schema:
+--   * lock_token identifies one lock acquisition, so a late or stale release only deletes
+--     the row it wrote, never a newer lock taken under the same locked_by
+-- Fresh containers already get this from nodeN.sql.
+-- For existing volumes, run once against each node's database.
+
+ALTER TABLE distributed_lock
+    ADD COLUMN lock_token CHAR(36) NULL AFTER lock_time;
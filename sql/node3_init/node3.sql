@@ -52,6 +52,7 @@ CREATE TABLE `distributed_lock` (
   `lock_name` VARCHAR(255) PRIMARY KEY,
   `locked_by` VARCHAR(255) NOT NULL,
   `lock_time` TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+  `lock_token` CHAR(36) NULL,
   INDEX `idx_locked_by` (`locked_by`),
   INDEX `idx_lock_time` (`lock_time`)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
@@ -70,12 +71,12 @@ CREATE TABLE recovery_log (
     status ENUM('PENDING', 'COMPLETED', 'FAILED') DEFAULT 'PENDING',
     retry_count INT DEFAULT 0,
     error_message TEXT NULL,
-    transaction_hash VARCHAR(64) NOT NULL,
+    transaction_hash CHAR(32) CHARACTER SET ascii COLLATE ascii_bin NOT NULL,
     
     INDEX idx_target_node (target_node),
-    INDEX idx_status (status),
+    INDEX idx_status_target_time (status, target_node, timestamp),
     INDEX idx_timestamp (timestamp),
-    INDEX idx_transaction_hash (transaction_hash)
+    UNIQUE KEY uk_tx_hash (transaction_hash)
 ) ENGINE=InnoDB;
 
 -- Global recovery checkpoint table
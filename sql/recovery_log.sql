@@ -7,10 +7,10 @@ CREATE TABLE IF NOT EXISTS recovery_log (
     status ENUM('PENDING', 'COMPLETED', 'FAILED') DEFAULT 'PENDING',
     retry_count INT DEFAULT 0,
     error_message TEXT NULL,
-    transaction_hash VARCHAR(64) NOT NULL,
+    transaction_hash CHAR(32) CHARACTER SET ascii COLLATE ascii_bin NOT NULL,
     
     INDEX idx_target_node (target_node),
-    INDEX idx_status (status),
+    INDEX idx_status_target_time (status, target_node, timestamp),
     INDEX idx_timestamp (timestamp),
-    INDEX idx_transaction_hash (transaction_hash)
+    UNIQUE KEY uk_tx_hash (transaction_hash)
 ) ENGINE=InnoDB;
\ No newline at end of file
@@ -0,0 +1,29 @@
+-- Brings an existing recovery_log table up to the current schema:
+--   * transaction_hash is a unique 32-character key, so log_backup can dedup with a single upsert
+--   * (status, target_node, timestamp) serves the pending-log scan for one target node
+-- Fresh containers already get these from nodeN.sql.
+-- For existing volumes, run once against each node's database.
+
+-- Older rows hold 64-character SHA-256 hashes; keep their first 32 characters
+UPDATE recovery_log SET transaction_hash = LEFT(transaction_hash, 32);
+
+-- Keep one row per hash that was logged more than once. The old log_backup only logged a
+-- hash again after its earlier row FAILED, so a live COMPLETED or PENDING row wins over a
+-- FAILED one (matching the new upsert, which leaves those alone); ties keep the oldest row
+DELETE r FROM recovery_log r
+JOIN (
+    SELECT log_id,
+           ROW_NUMBER() OVER (
+               PARTITION BY transaction_hash
+               ORDER BY FIELD(status, 'COMPLETED', 'PENDING', 'FAILED'), log_id
+           ) AS keep_rank
+    FROM recovery_log
+) ranked ON ranked.log_id = r.log_id
+WHERE ranked.keep_rank > 1;
+
+ALTER TABLE recovery_log
+    MODIFY transaction_hash CHAR(32) CHARACTER SET ascii COLLATE ascii_bin NOT NULL,
+    DROP INDEX idx_transaction_hash,
+    ADD UNIQUE KEY uk_tx_hash (transaction_hash),
+    DROP INDEX idx_status,
+    ADD INDEX idx_status_target_time (status, target_node, timestamp);
@@ -0,0 +1,11 @@
+-- Secondary indexes on trans for the View Transactions filters and the View Reports aggregates.
+-- Runs after nodeN.sql on fresh containers (init scripts run in name order).
+-- For existing volumes, run once against each node's database.
+
+-- View Transactions: account_id / type filters with LIMIT
+-- (type is TEXT, so it can only be indexed by prefix)
+CREATE INDEX idx_trans_account_type ON trans (account_id, type(10));
+
+-- View Reports: MIN/MAX(amount) resolve from the index ends and the amount range
+-- breakdown scans the index instead of the table
+CREATE INDEX idx_trans_amount ON trans (amount);